@@ -18,7 +18,7 @@ The HTTP server (see http_server.py) is expected to:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from atlas.schema.context import Context
 from atlas.schema.state_schema import StateRecord
@@ -211,6 +211,8 @@ class QueryHandler:
         source: Optional[str] = None,
         review_status: Optional[str] = None,
         intent_id: Optional[str] = None,
+        source_state_ids: Optional[Iterable[str]] = None,
+        target_state_ids: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """
         List all transitions for a context, with optional filtering.
@@ -222,6 +224,12 @@ class QueryHandler:
             - source:        match TransitionRecord.metadata["source"].
             - review_status: match TransitionRecord.metadata["review_status"].
             - intent_id:     match Transition.intent_id.
+            - source_state_ids: Transition.source_state_id is one of these
+              (the outgoing transitions of several states at once).
+            - target_state_ids: Transition.target_state_id is one of these.
+
+        Unlike list_outgoing / list_incoming, unknown state ids are not an
+        error; they simply match no transitions.
 
         Response format:
             {
@@ -231,7 +239,26 @@ class QueryHandler:
         """
         self._require_context(context_id)
 
-        records = list(self.store.list_transitions(context_id))
+        targets = None if target_state_ids is None else set(target_state_ids)
+        if source_state_ids is not None:
+            # Walk the adjacency index instead of every transition.
+            records = [
+                r
+                for state_id in dict.fromkeys(source_state_ids)
+                for r in self.store.list_outgoing(context_id, state_id)
+            ]
+            if targets is not None:
+                records = [
+                    r for r in records if r.transition.target_state_id in targets
+                ]
+        elif targets is not None:
+            records = [
+                r
+                for state_id in dict.fromkeys(target_state_ids)
+                for r in self.store.list_incoming(context_id, state_id)
+            ]
+        else:
+            records = list(self.store.list_transitions(context_id))
 
         if source is not None:
             records = [
@@ -31,6 +31,11 @@ Typical usage from an HTTP server:
             return 200, result
         except WorkflowError as e:
             return 404, {"error": str(e)}
+
+    def get_workflows(ids_param: str, expand: bool):
+        # GET /workflows?ids=a,b,c
+        ids = [i for i in ids_param.split(",") if i]
+        return 200, handler.get_workflows(ids, expand_transitions=expand)
 """
 
 from __future__ import annotations
@@ -356,6 +361,54 @@ class WorkflowHandler:
 
         return response
 
+    def get_workflows(
+        self,
+        workflow_ids: List[str],
+        *,
+        expand_transitions: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Retrieve several workflows in one call (GET /workflows?ids=a,b,c).
+
+        Args:
+            workflow_ids: Identifiers of the workflows, in the order the
+                results should be returned. Duplicates are ignored.
+            expand_transitions: Same meaning as in `get_workflow`.
+
+        Response:
+            {
+              "workflows": [
+                { "workflow": {...}, "transitions": [...] },  # per get_workflow
+                ...
+              ],
+              "missing": [ "unknown_id", ... ]
+            }
+
+        Unknown ids are reported under `missing` instead of failing the
+        whole batch.
+        """
+        results: List[Dict[str, Any]] = []
+        missing: List[str] = []
+        seen: Set[str] = set()
+
+        for workflow_id in workflow_ids:
+            if workflow_id in seen:
+                continue
+            seen.add(workflow_id)
+            try:
+                results.append(
+                    self.get_workflow(
+                        workflow_id, expand_transitions=expand_transitions
+                    )
+                )
+            except WorkflowError:
+                missing.append(workflow_id)
+
+        return {
+            "workflows": results,
+            "missing": missing,
+        }
+
     def list_workflows(
         self,
         *,
@@ -17,11 +17,14 @@ a more robust framework, keeping the same handlers/endpoints.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import logging
+import zlib
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from atlas.api.auth import AuthError, Authenticator, AuthConfig
@@ -97,8 +100,11 @@ class AtlasRequestHandler(BaseHTTPRequestHandler):
         """
         Read and parse JSON request body into a dict or list.
 
+        Bodies sent with "Content-Encoding: gzip" are decompressed first.
+
         Raises:
-            ValueError if the body is not valid JSON.
+            ValueError if the body is not valid JSON, or uses an
+            unsupported or corrupt content encoding.
         """
         length_header = self.headers.get("Content-Length")
         if length_header is None:
@@ -112,6 +118,15 @@ class AtlasRequestHandler(BaseHTTPRequestHandler):
         if not raw:
             return {}
 
+        encoding = (self.headers.get("Content-Encoding") or "identity").strip().lower()
+        if encoding == "gzip":
+            try:
+                raw = gzip.decompress(raw)
+            except (OSError, EOFError, zlib.error) as exc:
+                raise ValueError(f"Invalid gzip request body: {exc}") from exc
+        elif encoding != "identity":
+            raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
         try:
             payload = json.loads(raw.decode("utf-8"))
         except json.JSONDecodeError as exc:
@@ -124,9 +139,22 @@ class AtlasRequestHandler(BaseHTTPRequestHandler):
     ) -> None:
         """
         Send a JSON response with the given HTTP status and payload.
+
+        Successful GET responses carry an `ETag` (a hash of the body); a
+        request whose `If-None-Match` already names it gets a bodiless
+        304 instead.
         """
         body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
+        if self.command == "GET" and status == HTTPStatus.OK:
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            if self._etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            headers = {**(headers or {}), "ETag": etag}
+
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
@@ -297,8 +325,16 @@ class AtlasRequestHandler(BaseHTTPRequestHandler):
         # /contexts/{ctx}/transitions...
         if resource == "transitions":
             if len(parts) == 3:
-                # GET /contexts/{ctx}/transitions
-                payload = self.app.query.list_transitions(context_id)
+                # GET /contexts/{ctx}/transitions[?source_in=a,b][&target_in=c,d]
+                payload = self.app.query.list_transitions(
+                    context_id,
+                    source_state_ids=self._get_list_query_param(
+                        query_params, "source_in"
+                    ),
+                    target_state_ids=self._get_list_query_param(
+                        query_params, "target_in"
+                    ),
+                )
                 self._send_json(HTTPStatus.OK, payload)
                 return
 
@@ -406,6 +442,32 @@ class AtlasRequestHandler(BaseHTTPRequestHandler):
             return values[0]
         return str(values)
 
+    @staticmethod
+    def _get_list_query_param(params: Dict[str, Any], name: str) -> Optional[List[str]]:
+        """
+        Return a comma-separated (and/or repeated) query parameter as a list,
+        or None if it is absent.
+        """
+        values = params.get(name)
+        if values is None:
+            return None
+        if not isinstance(values, list):
+            values = [values]
+        return [item for value in values for item in str(value).split(",") if item]
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Return True if an If-None-Match header value names `etag` (or is "*")."""
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == "*" or candidate == etag:
+                return True
+        return False
+
 
 # --------------------------------------------------------------------------- #
 # Convenience entrypoint
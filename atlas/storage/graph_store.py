@@ -92,8 +92,14 @@ class GraphStore:
 
         If a context with the same id exists, it is replaced.
 
-        Respects `max_contexts` if configured.
+        Respects `max_contexts` if configured. Without a cap this is a
+        single dict assignment (atomic under the GIL), so the lock is
+        only taken when the capacity check needs to be consistent.
         """
+        if self._config.max_contexts is None:
+            self._contexts[context.context_id] = context
+            return
+
         with self._lock:
             if (
                 self._config.max_contexts is not None
@@ -123,13 +129,13 @@ class GraphStore:
 
     def get_context(self, context_id: str) -> Optional[Context]:
         """Return a Context by id, or None if not found."""
-        with self._lock:
-            return self._contexts.get(context_id)
+        # Read-only dict lookup; atomic under the GIL, no lock needed.
+        return self._contexts.get(context_id)
 
     def list_contexts(self) -> List[Context]:
         """Return all known contexts."""
-        with self._lock:
-            return list(self._contexts.values())
+        # list(dict.values()) runs without releasing the GIL.
+        return list(self._contexts.values())
 
     # ------------------------------------------------------------------ #
     # State operations
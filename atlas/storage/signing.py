@@ -24,7 +24,7 @@ import hashlib
 import hmac
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 
 def _canonical_json_bytes(payload: Any) -> bytes:
@@ -84,6 +84,9 @@ class Signer:
         self._config = config
         self._key_bytes = config.secret.encode("utf-8")
         self._digestmod = config.get_digestmod()
+        # Keyed HMAC with the padded key already absorbed; copied per
+        # signature so the key schedule is not recomputed every time.
+        self._hmac_prototype = hmac.new(self._key_bytes, digestmod=self._digestmod)
 
     # ------------------------------------------------------------------ #
     # Core operations
@@ -99,8 +102,22 @@ class Signer:
 
         Example return value: "Yk0QkF-...".
         """
-        canon = _canonical_json_bytes(payload)
-        raw = hmac.new(self._key_bytes, canon, self._digestmod).digest()
+        return self._sign_bytes(_canonical_json_bytes(payload))
+
+    def sign_many(self, records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Lazily compute signatures for many payloads.
+
+        Equivalent to `(signer.sign(r) for r in records)`; intended for
+        pipelines that sign thousands of records in one pass.
+        """
+        for record in records:
+            yield self.sign(record)
+
+    def _sign_bytes(self, canon: bytes) -> str:
+        mac = self._hmac_prototype.copy()
+        mac.update(canon)
+        raw = mac.digest()
         # URL-safe base64 without trailing '=' padding to keep it compact.
         return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
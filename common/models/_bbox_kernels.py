@@ -0,0 +1,111 @@
+"""
+Bounding-box hit-testing kernels for UIState.
+
+This is an internal helper for `common.models.ui_state`. The kernels work
+on the struct-of-arrays view returned by `UIState.bbox_arrays()` (four
+parallel integer arrays: xs, ys, widths, heights) and return the indices
+of matching boxes.
+
+If NumPy and Numba are installed, large inputs are dispatched to
+JIT-compiled loops; otherwise (and for small inputs, where conversion
+overhead dominates) a pure-Python implementation is used. Both paths
+return the same indices in ascending order.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, List
+
+try:  # Optional acceleration
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+    njit = None
+
+
+# Below this many boxes the pure-Python loop is faster than wrapping the
+# arrays and calling into compiled code.
+_JIT_MIN_SIZE = 256
+
+
+def contains(
+    xs: array, ys: array, ws: array, hs: array, px: int, py: int
+) -> List[int]:
+    """Return indices of boxes that contain the point (px, py)."""
+    if _contains_mask is not None and len(xs) >= _JIT_MIN_SIZE:
+        mask = _contains_mask(_view(xs), _view(ys), _view(ws), _view(hs), px, py)
+        return np.flatnonzero(mask).tolist()
+
+    return [
+        i
+        for i, (bx, by, bw, bh) in enumerate(zip(xs, ys, ws, hs))
+        if bx <= px < bx + bw and by <= py < by + bh
+    ]
+
+
+def intersect_any(
+    xs: array,
+    ys: array,
+    ws: array,
+    hs: array,
+    qx: int,
+    qy: int,
+    qw: int,
+    qh: int,
+) -> List[int]:
+    """Return indices of boxes that overlap the rectangle (qx, qy, qw, qh)."""
+    if _intersect_mask is not None and len(xs) >= _JIT_MIN_SIZE:
+        mask = _intersect_mask(
+            _view(xs), _view(ys), _view(ws), _view(hs), qx, qy, qw, qh
+        )
+        return np.flatnonzero(mask).tolist()
+
+    qx2 = qx + qw
+    qy2 = qy + qh
+    return [
+        i
+        for i, (bx, by, bw, bh) in enumerate(zip(xs, ys, ws, hs))
+        if bx < qx2 and qx < bx + bw and by < qy2 and qy < by + bh
+    ]
+
+
+def _view(arr: array) -> Any:
+    # Zero-copy NumPy view over the array.array buffer.
+    return np.frombuffer(arr, dtype=f"i{arr.itemsize}")
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _contains_mask(xs, ys, ws, hs, px, py):  # type: ignore[no-redef]
+        n = xs.shape[0]
+        out = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            out[i] = (
+                xs[i] <= px
+                and px < xs[i] + ws[i]
+                and ys[i] <= py
+                and py < ys[i] + hs[i]
+            )
+        return out
+
+    @njit(cache=True)
+    def _intersect_mask(xs, ys, ws, hs, qx, qy, qw, qh):  # type: ignore[no-redef]
+        n = xs.shape[0]
+        out = np.zeros(n, dtype=np.bool_)
+        qx2 = qx + qw
+        qy2 = qy + qh
+        for i in range(n):
+            out[i] = (
+                xs[i] < qx2
+                and qx < xs[i] + ws[i]
+                and ys[i] < qy2
+                and qy < ys[i] + hs[i]
+            )
+        return out
+
+else:
+    _contains_mask = None
+    _intersect_mask = None
@@ -0,0 +1,77 @@
+"""
+Code generation helpers for the common models.
+
+`fast_to_dict` generates a specialized `to_dict` method for a dataclass at
+class-definition time. The generated function is a single dict literal with
+one entry per public field, so serialization does not reflect over fields
+or branch per call. This is the same technique `dataclasses` itself uses to
+build `__init__` and `__repr__`.
+
+Per-field conversions (enum values, nested `to_dict()`, defensive copies)
+are given as Python expressions over `self`; they are evaluated in the
+globals of the module that defines the class, so module-level helpers can
+be referenced by name.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import fields, is_dataclass
+from typing import Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T", bound=type)
+
+
+def fast_to_dict(
+    *,
+    exprs: Optional[Dict[str, str]] = None,
+    doc: Optional[str] = None,
+) -> Callable[[T], T]:
+    """
+    Class decorator that installs a generated `to_dict` on a dataclass.
+
+    Args:
+        exprs:
+            Optional mapping of field name -> Python expression (using
+            `self`) used to produce that key's value. Fields not listed
+            are emitted as `self.<name>`.
+        doc:
+            Optional docstring for the generated method.
+
+    Fields whose names start with an underscore are treated as private
+    and omitted. Keys are emitted in field declaration order.
+
+    Apply this decorator *above* `@dataclass(...)`, so that it receives
+    the final class (with `slots=True`, dataclass returns a new class).
+    """
+
+    def wrap(cls: T) -> T:
+        if not is_dataclass(cls):
+            raise TypeError(f"fast_to_dict requires a dataclass, got {cls!r}")
+
+        overrides = dict(exprs or {})
+        entries = []
+        for f in fields(cls):
+            if f.name.startswith("_"):
+                continue
+            expr = overrides.pop(f.name, f"self.{f.name}")
+            entries.append(f"        {f.name!r}: {expr},")
+
+        if overrides:
+            unknown = ", ".join(sorted(overrides))
+            raise TypeError(f"fast_to_dict: unknown field(s) for {cls.__name__}: {unknown}")
+
+        source = "def to_dict(self):\n    return {\n" + "\n".join(entries) + "\n    }\n"
+
+        module_globals = sys.modules[cls.__module__].__dict__
+        namespace: Dict[str, object] = {}
+        exec(source, module_globals, namespace)
+
+        fn = namespace["to_dict"]
+        fn.__qualname__ = f"{cls.__qualname__}.to_dict"  # type: ignore[attr-defined]
+        fn.__module__ = cls.__module__  # type: ignore[attr-defined]
+        fn.__doc__ = doc or f"Serialize the {cls.__name__} to a JSON-friendly dict."
+        setattr(cls, "to_dict", fn)
+        return cls
+
+    return wrap
@@ -0,0 +1,89 @@
+"""
+Character trie over normalized intent names.
+
+This is an internal helper for `common.models.intents`. It stores the
+normalized id, label, and synonyms of each registered intent so that
+prefix queries (e.g. CLI autocomplete) run in O(m) for a prefix of
+length m, plus the size of the matching subtree.
+
+Exact lookups should keep using the hash-based registry in `intents.py`;
+the trie is only meant for prefix-style resolution.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _TrieNode(Generic[T]):
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode[T]] = {}
+        self.values: List[T] = []
+
+
+class IntentTrie(Generic[T]):
+    """
+    Minimal trie mapping normalized keys to one or more values.
+
+    Keys are expected to be normalized by the caller (lower-cased,
+    whitespace-collapsed); the trie does not transform them.
+    """
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[T] = _TrieNode()
+
+    def insert(self, key: str, value: T) -> None:
+        """Associate `value` with `key`. Duplicate (key, value) pairs are ignored."""
+        node = self._root
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                child = _TrieNode()
+                node.children[ch] = child
+            node = child
+        if not any(v is value for v in node.values):
+            node.values.append(value)
+
+    def find_prefix(self, prefix: str) -> List[T]:
+        """
+        Return all distinct values whose key starts with `prefix`.
+
+        Values are returned in key order (shorter keys first, then
+        insertion order of children), with duplicates removed.
+        """
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+
+        seen: set[int] = set()
+        result: List[T] = []
+        for value in self._iter_values(node):
+            marker = id(value)
+            if marker in seen:
+                continue
+            seen.add(marker)
+            result.append(value)
+        return result
+
+    def _find_node(self, prefix: str) -> Optional[_TrieNode[T]]:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)  # type: ignore[assignment]
+            if node is None:
+                return None
+        return node
+
+    @staticmethod
+    def _iter_values(start: _TrieNode[T]) -> Iterator[T]:
+        # Breadth-first so that shorter (closer) completions come first.
+        level = [start]
+        while level:
+            next_level: List[_TrieNode[T]] = []
+            for node in level:
+                yield from node.values
+                next_level.extend(node.children.values())
+            level = next_level
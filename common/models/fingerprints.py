@@ -20,10 +20,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _sha256_hex(data: bytes) -> str:
     """Return SHA-256 hex digest for the given bytes."""
     return hashlib.sha256(data).hexdigest()
@@ -146,7 +150,7 @@ def compute_semantic_fingerprint(text: str) -> str:
         text = " ".join(all_labels_in_tree)
         semantic_hash = compute_semantic_fingerprint(text)
     """
-    normalized = " ".join(text.strip().lower().split())
+    normalized = _WHITESPACE_RE.sub(" ", text.strip().lower())
     return _sha256_hex(normalized.encode("utf-8"))
 
 
@@ -9,9 +9,13 @@ concrete UI interactions across different applications and platforms.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from ._intent_trie import IntentTrie
 
 
 class IntentCategory(str, Enum):
@@ -32,7 +36,13 @@ class IntentCategory(str, Enum):
     OTHER = "other"
 
 
-@dataclass(frozen=True)
+# Member -> interned wire value, used by Intent.to_dict.
+_INTENT_CATEGORY_VALUES: Dict[IntentCategory, str] = {
+    c: sys.intern(c.value) for c in IntentCategory
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Intent:
     """
     A semantic intent that can be attached to transitions.
@@ -55,23 +65,73 @@ class Intent:
     synonyms: List[str] = field(default_factory=list)
     external_refs: Dict[str, str] = field(default_factory=dict)
 
+    # Normalized forms of id/label/synonyms, computed once at construction.
+    # Synonyms are treated as fixed after the intent is created.
+    _norm_id: str = field(init=False, repr=False, compare=False)
+    _norm_label: str = field(init=False, repr=False, compare=False)
+    _norm_synonyms: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    # id, label, then synonyms (in declaration order), all normalized.
+    _all_norm_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Serialized scalar fields, filled by the first to_dict() call.
+    _as_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        norm_id = _normalize(self.id)
+        norm_label = _normalize(self.label)
+        norm_synonyms = tuple(_normalize(s) for s in self.synonyms)
+        object.__setattr__(self, "_norm_id", norm_id)
+        object.__setattr__(self, "_norm_label", norm_label)
+        object.__setattr__(self, "_norm_synonyms", frozenset(norm_synonyms))
+        object.__setattr__(
+            self, "_all_norm_names", (norm_id, norm_label) + norm_synonyms
+        )
+
     def matches_phrase(self, phrase: str) -> bool:
         """Return True if the phrase looks like this intent or one of its synonyms."""
         key = _normalize(phrase)
-        if key == _normalize(self.label):
-            return True
-        if key == _normalize(self.id):
-            return True
-        return key in (_normalize(s) for s in self.synonyms)
+        return (
+            key == self._norm_label
+            or key == self._norm_id
+            or key in self._norm_synonyms
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the intent to a JSON-friendly dict.
+
+        The scalar fields are serialized once and reused; every call
+        returns a new dict with fresh `synonyms` / `external_refs` copies.
+        """
+        data = self._as_dict
+        if data is None:
+            data = {
+                "id": self.id,
+                "category": _INTENT_CATEGORY_VALUES[self.category],
+                "label": self.label,
+                "description": self.description,
+            }
+            object.__setattr__(self, "_as_dict", data)
+        return {
+            **data,
+            "synonyms": list(self.synonyms),
+            "external_refs": dict(self.external_refs),
+        }
 
 
 # --- Internal registry --------------------------------------------------------
 
-_INTENTS_BY_ID: Dict[str, Intent] = {}
-_INTENTS_BY_SYNONYM: Dict[str, Intent] = {}
-_INTENTS_BY_EXTERNAL: Dict[str, Intent] = {}
+# A single table holds every lookup kind, distinguished by key prefix:
+#   "id:<normalized id>", "syn:<normalized name>", "ext:<namespace>:<ref>"
+_INTENTS: Dict[str, Intent] = {}
+_ID_PREFIX = "id:"
+_SYN_PREFIX = "syn:"
+_EXT_PREFIX = "ext:"
+_INTENT_NAME_TRIE: IntentTrie[Intent] = IntentTrie()
 
 
+@lru_cache(maxsize=4096)
 def _normalize(s: str) -> str:
     return " ".join(s.strip().lower().split())
 
@@ -83,29 +143,22 @@ def register_intent(intent: Intent) -> None:
     Intended to be called during module import for built-in intents.
     You can also call it at runtime to add custom intents.
     """
-    key = _normalize(intent.id)
-    if key in _INTENTS_BY_ID and _INTENTS_BY_ID[key] is not intent:
+    key = _ID_PREFIX + intent._norm_id
+    existing = _INTENTS.get(key)
+    if existing is not None and existing is not intent:
         raise ValueError(f"Intent with id '{intent.id}' is already registered")
 
-    _INTENTS_BY_ID[key] = intent
+    _INTENTS[key] = intent
 
-    for syn in _iter_all_names(intent):
-        syn_key = _normalize(syn)
+    for name in intent._all_norm_names:
         # Do not overwrite existing synonym mappings silently
-        if syn_key not in _INTENTS_BY_SYNONYM:
-            _INTENTS_BY_SYNONYM[syn_key] = intent
+        _INTENTS.setdefault(_SYN_PREFIX + name, intent)
+        _INTENT_NAME_TRIE.insert(name, intent)
 
     for namespace, ref_id in intent.external_refs.items():
-        ext_key = f"{namespace}:{ref_id}"
-        if ext_key not in _INTENTS_BY_EXTERNAL:
-            _INTENTS_BY_EXTERNAL[ext_key] = intent
+        _INTENTS.setdefault(f"{_EXT_PREFIX}{namespace}:{ref_id}", intent)
 
-
-def _iter_all_names(intent: Intent) -> Iterable[str]:
-    yield intent.id
-    yield intent.label
-    for s in intent.synonyms:
-        yield s
+    _intents_cache_clear()
 
 
 # --- Lookup helpers -----------------------------------------------------------
@@ -118,7 +171,7 @@ def get_intent(intent_id: str) -> Optional[Intent]:
     Returns:
         The Intent instance, or None if not registered.
     """
-    return _INTENTS_BY_ID.get(_normalize(intent_id))
+    return _get_intent_cached(intent_id)
 
 
 def find_intent_for_phrase(phrase: str) -> Optional[Intent]:
@@ -128,8 +181,33 @@ def find_intent_for_phrase(phrase: str) -> Optional[Intent]:
     This uses a simple synonym lookup; more advanced matching can be built
     on top by callers if needed.
     """
-    key = _normalize(phrase)
-    return _INTENTS_BY_SYNONYM.get(key)
+    return _find_intent_for_phrase_cached(phrase)
+
+
+@lru_cache(maxsize=1024)
+def _get_intent_cached(intent_id: str) -> Optional[Intent]:
+    return _INTENTS.get(_ID_PREFIX + _normalize(intent_id))
+
+
+@lru_cache(maxsize=1024)
+def _find_intent_for_phrase_cached(phrase: str) -> Optional[Intent]:
+    return _INTENTS.get(_SYN_PREFIX + _normalize(phrase))
+
+
+def _intents_cache_clear() -> None:
+    """Drop memoized lookups (including cached misses) after a registry change."""
+    _get_intent_cached.cache_clear()
+    _find_intent_for_phrase_cached.cache_clear()
+
+
+def find_intents_with_prefix(prefix: str) -> List[Intent]:
+    """
+    Return intents whose id, label, or a synonym starts with `prefix`.
+
+    Intended for autocomplete-style lookups; closer (shorter) matches are
+    returned first. An empty prefix returns every registered intent.
+    """
+    return _INTENT_NAME_TRIE.find_prefix(_normalize(prefix))
 
 
 def find_intent_by_external_ref(namespace: str, ref_id: str) -> Optional[Intent]:
@@ -139,7 +217,7 @@ def find_intent_by_external_ref(namespace: str, ref_id: str) -> Optional[Intent]
     Example:
         find_intent_by_external_ref("wd", "Q22676")
     """
-    return _INTENTS_BY_EXTERNAL.get(f"{namespace}:{ref_id}")
+    return _INTENTS.get(f"{_EXT_PREFIX}{namespace}:{ref_id}")
 
 
 def all_intents() -> List[Intent]:
@@ -148,7 +226,7 @@ def all_intents() -> List[Intent]:
 
     The order is not guaranteed; callers should sort if they need stability.
     """
-    return list(_INTENTS_BY_ID.values())
+    return [intent for key, intent in _INTENTS.items() if key.startswith(_ID_PREFIX)]
 
 
 # --- Built-in intents ---------------------------------------------------------
@@ -10,10 +10,12 @@ Transitions can optionally be annotated with a semantic intent.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
 
+from ._codegen import fast_to_dict
 from .intents import Intent
 
 
@@ -38,7 +40,26 @@ class ActionType(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+# Member -> interned wire value, so serialization is a dict probe rather
+# than an Enum `.value` descriptor lookup per call, and every serialized
+# record shares one str object per action type.
+_ACTION_TYPE_VALUES: Dict[ActionType, str] = {
+    t: sys.intern(t.value) for t in ActionType
+}
+
+# Generated `to_dict` expression for Action/Transition metadata: a shallow
+# copy, so callers can never write through to the model.
+_METADATA_EXPR = "dict(self.metadata)"
+
+
+@fast_to_dict(
+    exprs={
+        "type": "_ACTION_TYPE_VALUES[self.type]",
+        "metadata": _METADATA_EXPR,
+    },
+    doc="Serialize the action to a JSON-friendly dict.",
+)
+@dataclass(slots=True)
 class Action:
     """
     Concrete action that caused a transition.
@@ -62,17 +83,19 @@ class Action:
     raw_input: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize the action to a JSON-friendly dict."""
-        return {
-            "type": self.type.value,
-            "element_id": self.element_id,
-            "raw_input": self.raw_input,
-            "metadata": dict(self.metadata),
-        }
 
-
-@dataclass
+@fast_to_dict(
+    exprs={
+        "action": "self.action.to_dict()",
+        "confidence": "float(self.confidence)",
+        "metadata": _METADATA_EXPR,
+    },
+    doc=(
+        "Serialize the transition to a JSON-friendly dict.\n\n"
+        "This format is suitable for storage in Atlas or for export."
+    ),
+)
+@dataclass(slots=True)
 class Transition:
     """
     Directed transition from one UI state to another.
@@ -120,24 +143,6 @@ class Transition:
             return
         self.intent_id = intent.id
 
-    # --- serialization --------------------------------------------------------
-
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Serialize the transition to a JSON-friendly dict.
-
-        This format is suitable for storage in Atlas or for export.
-        """
-        return {
-            "id": self.id,
-            "source_state_id": self.source_state_id,
-            "target_state_id": self.target_state_id,
-            "action": self.action.to_dict(),
-            "intent_id": self.intent_id,
-            "confidence": float(self.confidence),
-            "metadata": dict(self.metadata),
-        }
-
     # --- convenience constructors ---------------------------------------------
 
     @classmethod
@@ -170,3 +175,4 @@ class Transition:
             confidence=confidence,
             metadata={},
         )
+
@@ -10,9 +10,21 @@ in the UI graph.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import json
+import sys
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+from . import _bbox_kernels
+from ._codegen import fast_to_dict
 
 
 class Platform(str, Enum):
@@ -26,7 +38,11 @@ class Platform(str, Enum):
     OTHER = "other"
 
 
-@dataclass(frozen=True)
+# Member -> interned wire value, used by the serializers below.
+_PLATFORM_VALUES: Dict[Platform, str] = {p: sys.intern(p.value) for p in Platform}
+
+
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
     """
     Screen-space bounding box for a UI element.
@@ -40,12 +56,41 @@ class BoundingBox:
     width: int
     height: int
 
+    # Derived views, computed once since the box is immutable.
+    _tuple: Tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+    _as_dict: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_tuple", (self.x, self.y, self.width, self.height))
+        object.__setattr__(
+            self,
+            "_as_dict",
+            {"x": self.x, "y": self.y, "width": self.width, "height": self.height},
+        )
+
     def as_tuple(self) -> tuple[int, int, int, int]:
         """Return (x, y, width, height)."""
-        return self.x, self.y, self.width, self.height
+        return self._tuple
 
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Return {"x", "y", "width", "height"}.
 
-@dataclass
+        The dict is built once; each call returns a copy of it.
+        """
+        return dict(self._as_dict)
+
+
+@fast_to_dict(
+    exprs={
+        "bounding_box": (
+            "self.bounding_box.to_dict() if self.bounding_box is not None else None"
+        ),
+        "metadata": "dict(self.metadata)",
+    },
+    doc="Serialize the element to a JSON-friendly dict.",
+)
+@dataclass(slots=True)
 class InteractiveElement:
     """
     An interactive element within a UI state.
@@ -62,20 +107,21 @@ class InteractiveElement:
     visible: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize the element to a JSON-friendly dict."""
-        data = asdict(self)
-        if self.bounding_box is not None:
-            data["bounding_box"] = {
-                "x": self.bounding_box.x,
-                "y": self.bounding_box.y,
-                "width": self.bounding_box.width,
-                "height": self.bounding_box.height,
-            }
-        return data
-
 
-@dataclass
+@fast_to_dict(
+    exprs={
+        "platform": "_PLATFORM_VALUES[self.platform]",
+        "fingerprints": "dict(self.fingerprints)",
+        "interactive_elements": "[el.to_dict() for el in self.interactive_elements]",
+        "metadata": "dict(self.metadata)",
+    },
+    doc=(
+        "Serialize the state to a JSON-friendly dict.\n\n"
+        "This is intended as a low-level representation that Atlas can\n"
+        "persist directly, or that can be further transformed into JSON-LD."
+    ),
+)
+@dataclass(slots=True)
 class UIState:
     """
     Representation of a single UI state.
@@ -114,55 +160,155 @@ class UIState:
     interactive_elements: List[InteractiveElement] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Lazily built lookup indexes over `interactive_elements`. They are
+    # rebuilt when the list is replaced or changes length; in-place edits
+    # of existing elements should go through the mutators below or call
+    # `invalidate_indexes()`. The indexed list itself is held (not its
+    # id(), which a new list can reuse once the old one is freed).
+    _indexed_list: Optional[List[InteractiveElement]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_len: int = field(default=-1, init=False, repr=False, compare=False)
+    _by_id: Dict[str, InteractiveElement] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_role: Dict[str, List[InteractiveElement]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_norm_label: Dict[str, List[InteractiveElement]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Struct-of-arrays view of bounding boxes (x, y, width, height), aligned
+    # with `_bbox_elements`. Built on demand, dropped with the indexes.
+    _bbox_arrays: Optional[Tuple[array, array, array, array]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bbox_elements: List[InteractiveElement] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
     # --- element lookup helpers ------------------------------------------------
 
     def get_element(self, element_id: str) -> Optional[InteractiveElement]:
         """Return the element with the given id, or None if not found."""
-        for el in self.interactive_elements:
-            if el.id == element_id:
-                return el
-        return None
+        self._ensure_indexes()
+        return self._by_id.get(element_id)
 
     def find_elements_by_role(self, role: str) -> List[InteractiveElement]:
         """Return all elements whose role matches (case-insensitive)."""
-        role_lower = role.lower()
-        return [el for el in self.interactive_elements if el.role.lower() == role_lower]
+        self._ensure_indexes()
+        return list(self._by_role.get(role.lower(), ()))
 
     def find_elements_by_label(self, label: str) -> List[InteractiveElement]:
         """
         Return all elements whose label matches the given label
         (case-insensitive, trimmed).
         """
-        key = _normalize(label)
-        result: List[InteractiveElement] = []
-        for el in self.interactive_elements:
-            if el.label is None:
-                continue
-            if _normalize(el.label) == key:
-                result.append(el)
-        return result
+        self._ensure_indexes()
+        return list(self._by_norm_label.get(_normalize(label), ()))
+
+    def bbox_arrays(self) -> Tuple[array, array, array, array]:
+        """
+        Return (xs, ys, widths, heights) as parallel integer arrays.
+
+        Only elements that have a bounding box are included, in the order
+        they appear in `interactive_elements`. The arrays are cached and
+        rebuilt when the element list changes; treat them as read-only.
+        """
+        self._ensure_indexes()
+        if self._bbox_arrays is None:
+            xs, ys, ws, hs = array("l"), array("l"), array("l"), array("l")
+            boxed: List[InteractiveElement] = []
+            for el in self.interactive_elements:
+                bb = el.bounding_box
+                if bb is None:
+                    continue
+                xs.append(bb.x)
+                ys.append(bb.y)
+                ws.append(bb.width)
+                hs.append(bb.height)
+                boxed.append(el)
+            self._bbox_arrays = (xs, ys, ws, hs)
+            self._bbox_elements = boxed
+        return self._bbox_arrays
+
+    def find_elements_containing(self, x: int, y: int) -> List[InteractiveElement]:
+        """Return all elements whose bounding box contains the point (x, y)."""
+        xs, ys, ws, hs = self.bbox_arrays()
+        boxed = self._bbox_elements
+        return [boxed[i] for i in _bbox_kernels.contains(xs, ys, ws, hs, x, y)]
+
+    def find_elements_intersecting(
+        self, x: int, y: int, width: int, height: int
+    ) -> List[InteractiveElement]:
+        """Return all elements whose bounding box overlaps the given rectangle."""
+        xs, ys, ws, hs = self.bbox_arrays()
+        boxed = self._bbox_elements
+        return [
+            boxed[i]
+            for i in _bbox_kernels.intersect_any(xs, ys, ws, hs, x, y, width, height)
+        ]
+
+    # --- element mutators ------------------------------------------------------
+
+    def add_element(self, element: InteractiveElement) -> None:
+        """Append an element and invalidate the lookup indexes."""
+        self.interactive_elements.append(element)
+        self.invalidate_indexes()
+
+    def remove_element(self, element_id: str) -> Optional[InteractiveElement]:
+        """Remove and return the element with the given id, if present."""
+        for i, el in enumerate(self.interactive_elements):
+            if el.id == element_id:
+                del self.interactive_elements[i]
+                self.invalidate_indexes()
+                return el
+        return None
+
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes so they are rebuilt on the next query."""
+        self._indexed_list = None
+
+    def _ensure_indexes(self) -> None:
+        elements = self.interactive_elements
+        if self._indexed_list is elements and self._indexed_len == len(elements):
+            return
+
+        by_id: Dict[str, InteractiveElement] = {}
+        by_role: Dict[str, List[InteractiveElement]] = {}
+        by_label: Dict[str, List[InteractiveElement]] = {}
+        for el in elements:
+            # First match wins, mirroring the previous linear scan.
+            by_id.setdefault(el.id, el)
+            by_role.setdefault(el.role.lower(), []).append(el)
+            if el.label is not None:
+                by_label.setdefault(_normalize(el.label), []).append(el)
+
+        self._by_id = by_id
+        self._by_role = by_role
+        self._by_norm_label = by_label
+        self._bbox_arrays = None
+        self._bbox_elements = []
+        self._indexed_list = elements
+        self._indexed_len = len(elements)
 
     # --- serialization ---------------------------------------------------------
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_json_bytes(self) -> bytes:
         """
-        Serialize the state to a JSON-friendly dict.
+        Serialize the state to compact UTF-8 JSON.
 
-        This is intended as a low-level representation that Atlas can
-        persist directly, or that can be further transformed into JSON-LD.
+        Uses orjson when it is installed and falls back to the standard
+        library otherwise. Both produce the same document as `to_dict()`.
         """
-        return {
-            "id": self.id,
-            "app_id": self.app_id,
-            "version": self.version,
-            "platform": self.platform.value,
-            "locale": self.locale,
-            "fingerprints": dict(self.fingerprints),
-            "screenshot_ref": self.screenshot_ref,
-            "interactive_elements": [el.to_dict() for el in self.interactive_elements],
-            "metadata": dict(self.metadata),
-        }
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
 
 
+@lru_cache(maxsize=4096)
 def _normalize(s: str) -> str:
     return " ".join(s.strip().lower().split())
@@ -29,6 +29,10 @@ Usage examples:
     python -m consumers.examples.cli-agent-example \
         --base-url http://localhost:8080 states --context-id YOUR_CTX_ID
 
+    # List states and transitions for a context in one go
+    python -m consumers.examples.cli-agent-example \
+        --base-url http://localhost:8080 graph --context-id YOUR_CTX_ID
+
     # Find shortest path between two states
     python -m consumers.examples.cli-agent-example \
         --base-url http://localhost:8080 path \
@@ -41,9 +45,10 @@ from __future__ import annotations
 
 import argparse
 import sys
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
 
-from consumers.sdk.client import AtlasClient, AtlasClientConfig, AtlasClientError
+from consumers.sdk.client import AtlasClient, AtlasClientConfig, AtlasClientError, get_client
 from consumers.sdk.types import ContextInfo, PathView, StateView, TransitionView
 
 
@@ -52,99 +57,139 @@ from consumers.sdk.types import ContextInfo, PathView, StateView, TransitionView
 # --------------------------------------------------------------------------- #
 
 
-def print_contexts(contexts: List[ContextInfo]) -> None:
+def print_contexts(contexts: List[ContextInfo], out: Optional[TextIO] = None) -> None:
+    out = out or sys.stdout
     if not contexts:
-        print("No contexts found.")
+        out.write("No contexts found.\n")
         return
 
+    lines: List[str] = []
     for ctx in contexts:
-        print(f"* context_id: {ctx.context_id}")
-        print(f"  app_id:     {ctx.app_id}")
+        lines.append(f"* context_id: {ctx.context_id}")
+        lines.append(f"  app_id:     {ctx.app_id}")
         if ctx.version:
-            print(f"  version:    {ctx.version}")
+            lines.append(f"  version:    {ctx.version}")
         if ctx.platform:
-            print(f"  platform:   {ctx.platform}")
+            lines.append(f"  platform:   {ctx.platform}")
         if ctx.locale:
-            print(f"  locale:     {ctx.locale}")
-        print()
+            lines.append(f"  locale:     {ctx.locale}")
+        lines.append("")
+    out.write("\n".join(lines) + "\n")
+
 
+# State flag suffixes indexed by (is_entry << 1) | is_terminal.
+_FLAG_TABLE = ("", " (terminal)", " (entry)", " (entry) (terminal)")
 
-def print_states(states: List[StateView]) -> None:
+_STATE_HEADER_TEMPLATE = (
+    "* state_id: {state_id}{flags}\n"
+    "  discovered_at:  {discovered_at}\n"
+    "  app_id:         {app_id}"
+)
+_STATE_FOOTER_TEMPLATE = (
+    "  tags:           {tags}\n"
+    "  elements:       {count}"
+)
+_ELEMENT_HINT_TEMPLATE = "    - [{role}] {id}{label}"
+
+
+def print_states(states: List[StateView], out: Optional[TextIO] = None) -> None:
+    out = out or sys.stdout
     if not states:
-        print("No states found.")
+        out.write("No states found.\n")
         return
 
+    header = _STATE_HEADER_TEMPLATE.format
+    footer = _STATE_FOOTER_TEMPLATE.format
+    hint = _ELEMENT_HINT_TEMPLATE.format
+
+    lines: List[str] = []
+    append = lines.append
     for s in states:
-        entry_flag = " (entry)" if s.is_entry else ""
-        term_flag = " (terminal)" if s.is_terminal else ""
-        print(f"* state_id: {s.state_id}{entry_flag}{term_flag}")
-        print(f"  discovered_at:  {s.discovered_at}")
-        print(f"  app_id:         {s.app_id}")
-        if s.version:
-            print(f"  version:        {s.version}")
-        if s.platform:
-            print(f"  platform:       {s.platform}")
-        if s.locale:
-            print(f"  locale:         {s.locale}")
-        print(f"  tags:           {', '.join(s.tags) if s.tags else '-'}")
-        print(f"  elements:       {len(s.interactive_elements)}")
+        version, platform, locale = s.version, s.platform, s.locale
+        tags = s.tags
+        elements = s.interactive_elements
+        n_elements = len(elements)
+
+        append(
+            header(
+                state_id=s.state_id,
+                flags=_FLAG_TABLE[(bool(s.is_entry) << 1) | bool(s.is_terminal)],
+                discovered_at=s.discovered_at,
+                app_id=s.app_id,
+            )
+        )
+        if version:
+            append(f"  version:        {version}")
+        if platform:
+            append(f"  platform:       {platform}")
+        if locale:
+            append(f"  locale:         {locale}")
+        append(footer(tags=", ".join(tags) if tags else "-", count=n_elements))
 
         # Show a few interactive elements as hints
-        for el in s.interactive_elements[:5]:
-            label = f" label='{el.label}'" if el.label else ""
-            print(f"    - [{el.role}] {el.id}{label}")
+        for el in elements[:5]:
+            label = el.label
+            append(hint(role=el.role, id=el.id, label=f" label='{label}'" if label else ""))
 
-        if len(s.interactive_elements) > 5:
-            print(f"    ... +{len(s.interactive_elements) - 5} more element(s)")
-        print()
+        if n_elements > 5:
+            append(f"    ... +{n_elements - 5} more element(s)")
+        append("")
+    out.write("\n".join(lines) + "\n")
 
 
-def print_transitions(transitions: List[TransitionView]) -> None:
+def print_transitions(
+    transitions: List[TransitionView], out: Optional[TextIO] = None
+) -> None:
+    out = out or sys.stdout
     if not transitions:
-        print("No transitions found.")
+        out.write("No transitions found.\n")
         return
 
+    lines: List[str] = []
     for t in transitions:
-        print(f"* transition_id: {t.transition_id}")
-        print(f"  {t.source_state_id} -> {t.target_state_id}")
-        print(f"  action.type:   {t.action.type}")
+        lines.append(f"* transition_id: {t.transition_id}")
+        lines.append(f"  {t.source_state_id} -> {t.target_state_id}")
+        lines.append(f"  action.type:   {t.action.type}")
         if t.action.element_id:
-            print(f"  element_id:    {t.action.element_id}")
+            lines.append(f"  element_id:    {t.action.element_id}")
         if t.intent_id:
-            print(f"  intent_id:     {t.intent_id}")
-        print(f"  confidence:    {t.confidence:.3f}")
-        print(f"  times_observed:{t.times_observed}")
-        print()
-
-
-def print_path(path: PathView) -> None:
-    print(f"context_id:     {path.context_id}")
-    print(f"source_state_id:{path.source_state_id}")
-    print(f"target_state_id:{path.target_state_id}")
-    print()
+            lines.append(f"  intent_id:     {t.intent_id}")
+        lines.append(f"  confidence:    {t.confidence:.3f}")
+        lines.append(f"  times_observed:{t.times_observed}")
+        lines.append("")
+    out.write("\n".join(lines) + "\n")
+
+
+def print_path(path: PathView, out: Optional[TextIO] = None) -> None:
+    out = out or sys.stdout
+    lines: List[str] = [
+        f"context_id:     {path.context_id}",
+        f"source_state_id:{path.source_state_id}",
+        f"target_state_id:{path.target_state_id}",
+        "",
+    ]
 
     if path.transitions is None:
-        print("No path found.")
-        return
-
-    if not path.transitions:
-        print("Source and target are the same state (empty path).")
-        return
-
-    print(f"Path length: {len(path.transitions)} transition(s)")
-    print()
-
-    for i, t in enumerate(path.transitions, start=1):
-        print(f"Step {i}:")
-        print(f"  transition_id: {t.transition_id}")
-        print(f"  from:          {t.source_state_id}")
-        print(f"  to:            {t.target_state_id}")
-        print(f"  action.type:   {t.action.type}")
-        if t.action.element_id:
-            print(f"  element_id:    {t.action.element_id}")
-        if t.intent_id:
-            print(f"  intent_id:     {t.intent_id}")
-        print()
+        lines.append("No path found.")
+    elif not path.transitions:
+        lines.append("Source and target are the same state (empty path).")
+    else:
+        lines.append(f"Path length: {len(path.transitions)} transition(s)")
+        lines.append("")
+
+        for i, t in enumerate(path.transitions, start=1):
+            lines.append(f"Step {i}:")
+            lines.append(f"  transition_id: {t.transition_id}")
+            lines.append(f"  from:          {t.source_state_id}")
+            lines.append(f"  to:            {t.target_state_id}")
+            lines.append(f"  action.type:   {t.action.type}")
+            if t.action.element_id:
+                lines.append(f"  element_id:    {t.action.element_id}")
+            if t.intent_id:
+                lines.append(f"  intent_id:     {t.intent_id}")
+            lines.append("")
+
+    out.write("\n".join(lines) + "\n")
 
 
 # --------------------------------------------------------------------------- #
@@ -152,14 +197,14 @@ def print_path(path: PathView) -> None:
 # --------------------------------------------------------------------------- #
 
 
-def cmd_health(client: AtlasClient) -> int:
+def cmd_health(client: AtlasClient, args: argparse.Namespace) -> int:
     data = client.health()
     print("Health:")
     print(data)
     return 0
 
 
-def cmd_contexts(client: AtlasClient) -> int:
+def cmd_contexts(client: AtlasClient, args: argparse.Namespace) -> int:
     contexts = client.list_contexts()
     print_contexts(contexts)
     return 0
@@ -187,6 +232,25 @@ def cmd_transitions(client: AtlasClient, args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_graph(client: AtlasClient, args: argparse.Namespace) -> int:
+    ctx_id = args.context_id
+    if not ctx_id:
+        print("Error: --context-id is required for 'graph' command.", file=sys.stderr)
+        return 1
+
+    # States and transitions are independent reads; issue them concurrently
+    # so the command costs one round-trip instead of two.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        states_future = pool.submit(client.list_states, ctx_id)
+        transitions_future = pool.submit(client.list_transitions, ctx_id)
+        states = states_future.result()
+        transitions = transitions_future.result()
+
+    print_states(states)
+    print_transitions(transitions)
+    return 0
+
+
 def cmd_path(client: AtlasClient, args: argparse.Namespace) -> int:
     ctx_id = args.context_id
     src = args.source
@@ -218,87 +282,114 @@ def cmd_path(client: AtlasClient, args: argparse.Namespace) -> int:
     return 0
 
 
+_COMMANDS: Dict[str, Callable[[AtlasClient, argparse.Namespace], int]] = {
+    "health": cmd_health,
+    "contexts": cmd_contexts,
+    "states": cmd_states,
+    "transitions": cmd_transitions,
+    "graph": cmd_graph,
+    "path": cmd_path,
+}
+
+
 # --------------------------------------------------------------------------- #
 # CLI setup
 # --------------------------------------------------------------------------- #
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="CLI example for querying Ariane Atlas.",
-    )
-
-    parser.add_argument(
-        "--base-url",
+def _add_states_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--context-id",
         required=True,
-        help="Base URL of the Atlas HTTP server (e.g. http://localhost:8080)",
-    )
-    parser.add_argument(
-        "--api-key",
-        default=None,
-        help="Optional API key for authenticated requests.",
-    )
-    parser.add_argument(
-        "--timeout",
-        type=int,
-        default=10,
-        help="HTTP timeout in seconds (default: 10).",
+        help="Context ID whose states should be listed.",
     )
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # health
-    subparsers.add_parser("health", help="Check server health.")
-
-    # contexts
-    subparsers.add_parser("contexts", help="List known contexts.")
 
-    # states
-    p_states = subparsers.add_parser("states", help="List states in a context.")
-    p_states.add_argument(
+def _add_transitions_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--context-id",
         required=True,
-        help="Context ID whose states should be listed.",
+        help="Context ID whose transitions should be listed.",
     )
 
-    # transitions
-    p_transitions = subparsers.add_parser(
-        "transitions",
-        help="List transitions in a context.",
-    )
-    p_transitions.add_argument(
+
+def _add_graph_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--context-id",
         required=True,
-        help="Context ID whose transitions should be listed.",
+        help="Context ID whose states and transitions should be listed.",
     )
 
-    # path
-    p_path = subparsers.add_parser(
-        "path",
-        help="Compute shortest path between two states.",
-    )
-    p_path.add_argument(
+
+def _add_path_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--context-id",
         required=True,
         help="Context ID in which to search.",
     )
-    p_path.add_argument(
+    p.add_argument(
         "--source",
         required=True,
         help="Source state ID.",
     )
-    p_path.add_argument(
+    p.add_argument(
         "--target",
         required=True,
         help="Target state ID.",
     )
-    p_path.add_argument(
+    p.add_argument(
         "--max-depth",
         type=int,
         default=None,
         help="Optional depth limit for path search.",
     )
 
+
+# name -> (help, argument registration or None)
+_SUBCOMMANDS: Dict[
+    str, Tuple[str, Optional[Callable[[argparse.ArgumentParser], None]]]
+] = {
+    "health": ("Check server health.", None),
+    "contexts": ("List known contexts.", None),
+    "states": ("List states in a context.", _add_states_args),
+    "transitions": ("List transitions in a context.", _add_transitions_args),
+    "graph": (
+        "List states and transitions in a context (fetched concurrently).",
+        _add_graph_args,
+    ),
+    "path": ("Compute shortest path between two states.", _add_path_args),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="CLI example for querying Ariane Atlas.",
+    )
+
+    parser.add_argument(
+        "--base-url",
+        required=True,
+        help="Base URL of the Atlas HTTP server (e.g. http://localhost:8080)",
+    )
+    parser.add_argument(
+        "--api-key",
+        default=None,
+        help="Optional API key for authenticated requests.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=10,
+        help="HTTP timeout in seconds (default: 10).",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, (help_text, add_args) in _SUBCOMMANDS.items():
+        p = subparsers.add_parser(name, help=help_text)
+        if add_args is not None:
+            add_args(p)
+
     return parser
 
 
@@ -311,23 +402,16 @@ def main(argv: Optional[list[str]] = None) -> int:
         api_key=args.api_key,
         timeout=args.timeout,
     )
-    client = AtlasClient(cfg)
-
-    try:
-        if args.command == "health":
-            return cmd_health(client)
-        if args.command == "contexts":
-            return cmd_contexts(client)
-        if args.command == "states":
-            return cmd_states(client, args)
-        if args.command == "transitions":
-            return cmd_transitions(client, args)
-        if args.command == "path":
-            return cmd_path(client, args)
+    client = get_client(cfg)
 
+    handler = _COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
         return 1
 
+    try:
+        return handler(client, args)
+
     except AtlasClientError as exc:
         print(f"AtlasClientError: {exc}", file=sys.stderr)
         if exc.raw_body:
@@ -19,26 +19,59 @@ from __future__ import annotations
 
 import argparse
 import sys
-from typing import Optional
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional, Sequence, TextIO
 
 from consumers.guidance import (
     GoalType,
     GuidanceGoal,
     GuidanceEngine,
     GuidanceEngineConfig,
+    GuidanceStep,
     GuidanceStepKind,
     LocalUISnapshot,
     NullProbe,
 )
-from consumers.sdk.client import AtlasClient
-from consumers.sdk.types import StateView
+from consumers.sdk.client import AtlasClientConfig, get_client
+from consumers.sdk.types import ContextInfo, StateView
 
 
-def _select_state_by_id(states, state_id: str) -> Optional[StateView]:
+# Step kinds after which the walk stops.
+_TERMINAL_STEP_KINDS = frozenset({GuidanceStepKind.ERROR, GuidanceStepKind.COMPLETE})
+
+
+def _index_states_by_id(states: Iterable[StateView]) -> Dict[str, StateView]:
+    """Map state_id -> StateView. The first state wins on duplicate ids."""
+    by_id: Dict[str, StateView] = {}
     for st in states:
-        if getattr(st, "state_id", None) == state_id:
-            return st
-    return None
+        by_id.setdefault(getattr(st, "state_id", None), st)
+    return by_id
+
+
+def print_step(step: GuidanceStep, out: Optional[TextIO] = None) -> None:
+    """Print one guidance step (followed by a blank line) in a single write."""
+    out = out or sys.stdout
+    lines = [
+        f"--- Step {step.step_index + 1} / {step.step_count} ---",
+        f"Kind       : {step.kind.value}",
+        f"Instruction: {step.instruction}",
+    ]
+
+    if step.notes:
+        lines.append(f"Notes      : {step.notes}")
+
+    if step.element_hint is not None:
+        hint = step.element_hint
+        lines.append("Element hint:")
+        lines.append(f"  id    : {getattr(hint, 'element_id', None)}")
+        lines.append(f"  role  : {hint.role}")
+        lines.append(f"  label : {hint.label}")
+        if hint.bounding_box is not None:
+            bb = hint.bounding_box
+            lines.append(f"  bbox  : x={bb.x}, y={bb.y}, w={bb.width}, h={bb.height}")
+
+    out.write("\n".join(lines) + "\n\n")
 
 
 def run_cli(
@@ -46,9 +79,19 @@ def run_cli(
     context_id: str,
     current_state_id: str,
     target_state_id: str,
+    *,
+    auto: bool = False,
+    delay_ms: int = 0,
 ) -> int:
+    """
+    Walk a guidance session from `current_state_id` to `target_state_id`.
+
+    With `auto=True` steps are advanced without waiting for the user,
+    pausing `delay_ms` milliseconds between steps (useful for scripted
+    runs and timing).
+    """
     # 1) Set up Atlas client and fetch context/states.
-    client = AtlasClient(base_url=base_url)
+    client = get_client(AtlasClientConfig(base_url=base_url))
 
     ctx = client.get_context(context_id)
     if ctx is None:
@@ -60,7 +103,8 @@ def run_cli(
         print(f"[error] No states found in context '{context_id}'.", file=sys.stderr)
         return 1
 
-    current_state = _select_state_by_id(states, current_state_id)
+    states_by_id = _index_states_by_id(states)
+    current_state = states_by_id.get(current_state_id)
     if current_state is None:
         print(
             f"[error] Current state '{current_state_id}' not found in context '{context_id}'.",
@@ -68,9 +112,15 @@ def run_cli(
         )
         return 1
 
+    if current_state_id == target_state_id:
+        print(f"[info] Already at target state '{target_state_id}'; nothing to do.")
+        return 0
+
     # 2) Synthesize a LocalUISnapshot from the current state's fingerprints.
     #    This lets the matching logic trivially resolve the current state.
-    fingerprints = dict(getattr(current_state, "fingerprints", {}) or {})
+    #    The state's own mapping is shared through a read-only view
+    #    rather than copied.
+    fingerprints = MappingProxyType(getattr(current_state, "fingerprints", None) or {})
 
     snapshot = LocalUISnapshot(
         context_hint=context_id,
@@ -96,14 +146,51 @@ def run_cli(
         label=f"Reach state {target_state_id}",
     )
 
-    # 6) Start a session using the synthetic snapshot.
-    session = engine.start_session(context_id=context_id, goal=goal, snapshot=snapshot)
-
     print("=== Ariane Guidance CLI Example ===")
     print(f"Atlas base URL : {base_url}")
     print(f"Context        : {context_id}")
     print(f"Current state  : {current_state_id}")
     print(f"Target state   : {target_state_id}")
+
+    # 6) Start and walk a session using the synthetic snapshot.
+    return run_one(
+        engine,
+        ctx,
+        goal,
+        snapshot,
+        states=states,
+        auto=auto,
+        delay_ms=delay_ms,
+    )
+
+
+def run_one(
+    engine: GuidanceEngine,
+    ctx: ContextInfo,
+    goal: GuidanceGoal,
+    snapshot: LocalUISnapshot,
+    *,
+    states: Optional[Sequence[StateView]] = None,
+    auto: bool = False,
+    delay_ms: int = 0,
+) -> int:
+    """
+    Start a guidance session for one goal and walk it to the end.
+
+    The engine (and its Atlas client), context and state list are taken
+    from the caller, so a harness iterating over many goals in the same
+    context sets them up once and only pays for plan construction here.
+    """
+    # The context and states are handed to the engine so it does not
+    # request them from Atlas again.
+    session = engine.start_session(
+        context_id=ctx.context_id,
+        goal=goal,
+        snapshot=snapshot,
+        context=ctx,
+        states=states,
+    )
+
     print(f"Plan status    : {session.plan.status.value}")
     print()
 
@@ -112,7 +199,7 @@ def run_cli(
         print(f"Session status: {session.status.value}")
         return 0
 
-    # 7) Walk through the guidance steps interactively.
+    # Walk through the guidance steps interactively.
     while True:
         step = session.current_step()
 
@@ -125,35 +212,24 @@ def run_cli(
                 print("[info] No current step but session is not terminal; stopping.")
                 break
 
-        print(f"--- Step {step.step_index + 1} / {step.step_count} ---")
-        print(f"Kind       : {step.kind.value}")
-        print(f"Instruction: {step.instruction}")
-
-        if step.notes:
-            print(f"Notes      : {step.notes}")
-
-        if step.element_hint is not None:
-            hint = step.element_hint
-            print("Element hint:")
-            print(f"  id    : {getattr(hint, 'element_id', None)}")
-            print(f"  role  : {hint.role}")
-            print(f"  label : {hint.label}")
-            if hint.bounding_box is not None:
-                bb = hint.bounding_box
-                print(f"  bbox  : x={bb.x}, y={bb.y}, w={bb.width}, h={bb.height}")
-
-        print()
+        print_step(step)
 
         # If this is an ERROR or COMPLETE step, we stop immediately.
-        if step.kind in (GuidanceStepKind.ERROR, GuidanceStepKind.COMPLETE):
+        if step.kind in _TERMINAL_STEP_KINDS:
             print(f"[terminal] Reached {step.kind.value} step. Stopping.")
             break
 
-        user_input = input("Press [Enter] once you've completed this step (or 'q' to quit): ").strip()
-        if user_input.lower() == "q":
-            print("[info] User requested quit. Ending session.")
-            break
+        if auto:
+            if delay_ms > 0:
+                time.sleep(delay_ms / 1000.0)
+        else:
+            user_input = input("Press [Enter] once you've completed this step (or 'q' to quit): ").strip()
+            if user_input.lower() == "q":
+                print("[info] User requested quit. Ending session.")
+                break
 
+        # Local only: the plan's steps were hydrated up front by one
+        # shortest_path call, so advancing costs no Atlas round-trip.
         session = engine.advance_session(session)
 
         if session.is_finished():
@@ -187,6 +263,17 @@ def main(argv: Optional[list[str]] = None) -> int:
         required=True,
         help="State ID that represents the target UI state.",
     )
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="Advance through steps without waiting for input (scripted runs).",
+    )
+    parser.add_argument(
+        "--delay-ms",
+        type=int,
+        default=0,
+        help="With --auto, pause this many milliseconds between steps (default: 0).",
+    )
 
     args = parser.parse_args(argv)
 
@@ -196,6 +283,8 @@ def main(argv: Optional[list[str]] = None) -> int:
             context_id=args.context_id,
             current_state_id=args.current_state_id,
             target_state_id=args.target_state_id,
+            auto=args.auto,
+            delay_ms=args.delay_ms,
         )
     except KeyboardInterrupt:
         print("\n[info] Interrupted by user.", file=sys.stderr)
@@ -18,20 +18,31 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Final, Iterable, List, Optional, Tuple
 
 import yaml  # Requires PyYAML
 
-from common.models.transition import Action, ActionType
+try:  # libyaml-backed loader; much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:  # Optional fast JSON encoder for large bundles
+    import orjson
+except ImportError:
+    orjson = None
+
+from common.models.transition import Action, ActionType, Transition
 from theseus.core.exporter import Exporter, ExporterConfig
 from theseus.core.state_tracker import StateTracker, StateTrackerConfig
 from theseus.drivers.web.browser_session import WebBrowserSession
 from theseus.recording.prompts import resolve_intent_from_phrase, suggest_intents_for_phrase
 from theseus.recording.session_recorder import SessionRecorder
-from consumers.sdk.client import AtlasClient, AtlasClientConfig, AtlasClientError
+from consumers.sdk.client import AtlasClientConfig, AtlasClientError, get_client
 
 
 # --------------------------------------------------------------------------- #
@@ -42,8 +53,10 @@ from consumers.sdk.client import AtlasClient, AtlasClientConfig, AtlasClientErro
 def load_config(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise SystemExit(f"Config file not found: {path}")
+    if _YamlLoader is yaml.SafeLoader:
+        print("[config] libyaml not available; using the pure-Python YAML loader", file=sys.stderr)
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}
     if "recorder" not in data:
         raise SystemExit("Config root must contain a 'recorder' key")
     return data["recorder"]
@@ -132,6 +145,7 @@ def cli_resolve_intent(text: str, *, suggest: bool) -> Optional[str]:
     if not text:
         return None
 
+    # Phrase lookups are memoized by the intent registry itself.
     intent = resolve_intent_from_phrase(text)
     if intent is not None:
         print(f"  → matched intent: {intent.id!r} ({intent.label})")
@@ -170,7 +184,11 @@ def cli_resolve_intent(text: str, *, suggest: bool) -> Optional[str]:
 # --------------------------------------------------------------------------- #
 
 
-def build_exporter(rec_cfg: Dict[str, Any], tracker: StateTracker) -> Exporter:
+def build_exporter(
+    rec_cfg: Dict[str, Any],
+    tracker: StateTracker,
+    transitions: Optional[List[Transition]] = None,
+) -> Exporter:
     app_cfg = rec_cfg.get("app", {}) or {}
     env_metadata = {
         "source": "human_recorder",
@@ -185,27 +203,120 @@ def build_exporter(rec_cfg: Dict[str, Any], tracker: StateTracker) -> Exporter:
         environment={},
         metadata=env_metadata,
     )
-    return Exporter(state_tracker=tracker, config=exp_cfg)
+    return Exporter(
+        state_tracker=tracker,
+        transitions=list(transitions or []),
+        config=exp_cfg,
+    )
 
 
-def export_to_filesystem(
-    bundle: Dict[str, Any],
-    rec_cfg: Dict[str, Any],
-    session_id: str,
-) -> None:
-    out_cfg = rec_cfg.get("output", {}).get("filesystem", {}) or {}
-    base_dir = Path(out_cfg.get("output_dir") or "./output/recordings")
-    use_ts = bool(out_cfg.get("use_timestamp_subdirs", True))
+def _dumps_line(obj: Any) -> bytes:
+    """Encode one compact JSON line for the spool."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads_line(line: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dumps_bundle_value(obj: Any, depth: int) -> bytes:
+    """
+    Encode `obj` as it appears `depth` levels deep in the bundle, in the
+    bundle's usual layout (2-space indent, sorted keys).
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+    # Encoded JSON strings never contain a raw newline, so every newline
+    # here is layout and can be shifted to the nesting depth.
+    return data.replace(b"\n", b"\n" + b"  " * depth)
+
 
-    if use_ts:
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        base_dir = base_dir / ts
+def _write_bundle_array(out: BinaryIO, items: Iterable[bytes]) -> None:
+    """Write encoded items as a top-level bundle array ("[]" when empty)."""
+    sep = b"[\n    "
+    for item in items:
+        out.write(sep + item)
+        sep = b",\n    "
+    out.write(b"[]" if sep == b"[\n    " else b"\n  ]")
 
-    base_dir.mkdir(parents=True, exist_ok=True)
 
-    path = base_dir / f"bundle-{session_id}.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(bundle, f, indent=2, sort_keys=True)
+class BundleSpool:
+    """
+    Append-only spool of transition records for filesystem export.
+
+    Each recorded transition is written as one JSON line as soon as it is
+    recorded, so serialization happens during the session instead of all
+    at once at the end. `finalize()` then writes the bundle by copying the
+    spooled lines into its "transitions" array and removes the spool.
+
+    If a session ends without `finalize()` (an error, Ctrl-C, a crash),
+    the spool is left next to the bundle path as
+    `bundle-<session_id>.transitions.jsonl`. It is not a bundle: states
+    are only written at finalize time. Each line is a complete
+    TransitionRecord dict, so the steps recorded so far can be read back
+    line by line with `json.loads` (e.g. to inspect them or re-record
+    the session); the last line may be truncated after a hard crash.
+    """
+
+    def __init__(self, bundle_path: Path) -> None:
+        self.bundle_path = bundle_path
+        self.spool_path = bundle_path.with_name(bundle_path.stem + ".transitions.jsonl")
+        self._fh = self.spool_path.open("wb")
+
+    @classmethod
+    def for_session(cls, rec_cfg: Dict[str, Any], session_id: str) -> "BundleSpool":
+        out_cfg = rec_cfg.get("output", {}).get("filesystem", {}) or {}
+        base_dir = Path(out_cfg.get("output_dir") or "./output/recordings")
+        use_ts = bool(out_cfg.get("use_timestamp_subdirs", True))
+
+        if use_ts:
+            ts = time.strftime("%Y%m%d-%H%M%S")
+            base_dir = base_dir / ts
+
+        base_dir.mkdir(parents=True, exist_ok=True)
+        return cls(base_dir / f"bundle-{session_id}.json")
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._fh.write(_dumps_line(record) + b"\n")
+        # Flush so an interrupted session still leaves its steps on disk.
+        self._fh.flush()
+
+    def close(self) -> None:
+        """Close the spool file and keep it on disk (see the class docstring)."""
+        self._fh.close()
+
+    def finalize(self, context: Dict[str, Any], states: List[Dict[str, Any]]) -> Path:
+        """Write the bundle next to the spool and return its path."""
+        self._fh.close()
+
+        tmp_path = self.bundle_path.with_name(self.bundle_path.name + ".tmp")
+        with tmp_path.open("wb") as out, self.spool_path.open("rb") as spool:
+            # Same layout as json.dump(bundle, indent=2, sort_keys=True)
+            # (byte-identical without orjson), written one record at a time.
+            out.write(b'{\n  "context": ' + _dumps_bundle_value(context, 1))
+            out.write(b',\n  "states": ')
+            _write_bundle_array(out, (_dumps_bundle_value(st, 2) for st in states))
+            out.write(b',\n  "transitions": ')
+            _write_bundle_array(
+                out, (_dumps_bundle_value(_loads_line(line), 2) for line in spool)
+            )
+            out.write(b"\n}")
+
+        os.replace(tmp_path, self.bundle_path)
+        self.spool_path.unlink()
+        return self.bundle_path
+
+
+def export_to_filesystem(exporter: Exporter, spool: BundleSpool) -> None:
+    context = exporter.build_context().to_dict()
+    states = [s.to_dict() for s in exporter.build_state_records()]
+    path = spool.finalize(context, states)
 
     print(f"[export] wrote bundle to {path}")
 
@@ -225,7 +336,7 @@ def export_to_atlas(
         timeout=timeout,
         api_key_header="X-API-Key",
     )
-    client = AtlasClient(client_cfg)
+    client = get_client(client_cfg)
 
     try:
         result = client.ingest_bundle(bundle)
@@ -242,7 +353,38 @@ def export_to_atlas(
 # --------------------------------------------------------------------------- #
 
 
-def run_interactive(rec_cfg: Dict[str, Any]) -> None:
+# Operator-typed action names -> ActionType. Every ActionType value is
+# accepted as-is, plus a few shorthands.
+_ACTION_TYPE_MAP: Final[Dict[str, ActionType]] = {
+    **{t.value: t for t in ActionType},
+    "key": ActionType.KEY_PRESS,
+    "text": ActionType.TEXT_INPUT,
+    # ActionType has no navigation member; record these as OTHER.
+    "navigation": ActionType.OTHER,
+    "nav": ActionType.OTHER,
+}
+
+
+def _parse_step_line(line: str) -> Tuple[str, Optional[str], Optional[str], str]:
+    """
+    Split a one-line step description into its fields.
+
+    Format: "type[, element id[, text/keys[, what you were trying to do]]]".
+    The last field may itself contain commas.
+    """
+    parts = [p.strip() for p in line.split(",", 3)]
+    parts += [""] * (4 - len(parts))
+    return parts[0], parts[1] or None, parts[2] or None, parts[3]
+
+
+def run_interactive(rec_cfg: Dict[str, Any], *, verbose: bool = False) -> None:
+    """
+    Record steps until the operator enters an empty action type, then export.
+
+    By default each step is described on a single line (see
+    `_parse_step_line`), entered after the action was performed in the UI.
+    With `verbose=True` every field is prompted for separately.
+    """
     driver = build_driver(rec_cfg)
     tracker = build_tracker(rec_cfg)
     recorder = build_recorder(rec_cfg, driver, tracker)
@@ -260,81 +402,92 @@ def run_interactive(rec_cfg: Dict[str, Any]) -> None:
     print(f"[session] session_id={recorder.session_id}")
     print(f"[session] initial state id: {initial_state.id}")
 
-    step_index = 0
-
-    while True:
-        print()
-        print(f"--- Step {step_index} ---")
-        print("Perform the next action in the UI, then describe it.")
-        print("Enter an empty action type to finish recording.")
-
-        raw_type = input(
-            "Action type [click/key/text_input/navigation/scroll/other]: "
-        ).strip()
-        if not raw_type:
-            print("[session] recording finished by user.")
-            break
-
-        raw_type_norm = raw_type.lower()
-        type_map = {
-            "click": ActionType.CLICK,
-            "key": ActionType.KEY,
-            "text_input": ActionType.TEXT_INPUT,
-            "text": ActionType.TEXT_INPUT,
-            "navigation": ActionType.NAVIGATION,
-            "nav": ActionType.NAVIGATION,
-            "scroll": ActionType.SCROLL,
-            "other": ActionType.OTHER,
-        }
-        action_type = type_map.get(raw_type_norm, ActionType.OTHER)
-
-        element_id = input("Element id (optional): ").strip() or None
-        raw_input_val: Optional[str] = None
-        if action_type in (ActionType.KEY, ActionType.TEXT_INPUT):
-            raw_input_val = input("Text/keys entered (optional, will be stored as metadata): ").strip() or None
-
-        action = Action(
-            type=action_type,
-            element_id=element_id,
-            raw_input=raw_input_val,
-            metadata={},
-        )
-
-        intent_id: Optional[str] = None
-        if ask_intent_per_step:
-            desc = input("What were you trying to do? (free text, optional): ").strip()
-            if desc:
-                intent_id = cli_resolve_intent(desc, suggest=suggest_intents)
+    output_cfg = rec_cfg.get("output", {}) or {}
+    mode = (output_cfg.get("mode") or "atlas").lower()
 
-        # Let the human perform the action and then confirm
-        input("Press Enter AFTER you have performed this action in the UI...")
+    # Transition records are produced as steps are recorded; in filesystem
+    # mode they are spooled to disk right away.
+    exporter = build_exporter(rec_cfg, tracker)
+    spool = BundleSpool.for_session(rec_cfg, recorder.session_id) if mode == "filesystem" else None
 
-        # Capture the new state explicitly to keep the flow obvious
-        next_state = driver.capture_state()
+    step_index = 0
 
-        step = recorder.record_step(
-            action,
-            intent_id=intent_id,
-            next_state=next_state,
-        )
+    try:
+        while True:
+            print()
+            print(f"--- Step {step_index} ---")
+            print("Perform the next action in the UI, then describe it.")
+            print("Enter an empty action type to finish recording.")
+
+            element_id: Optional[str] = None
+            raw_input_val: Optional[str] = None
+            desc = ""
+
+            if verbose:
+                raw_type = input(
+                    "Action type [click/key/text_input/navigation/scroll/other]: "
+                ).strip()
+            else:
+                raw_type, element_id, raw_input_val, desc = _parse_step_line(
+                    input("Step [type, element id, text/keys, what you were trying to do]: ")
+                )
+            if not raw_type:
+                print("[session] recording finished by user.")
+                break
+
+            action_type = _ACTION_TYPE_MAP.get(raw_type.lower(), ActionType.OTHER)
+
+            if verbose:
+                element_id = input("Element id (optional): ").strip() or None
+                if action_type in (ActionType.KEY_PRESS, ActionType.TEXT_INPUT):
+                    raw_input_val = input("Text/keys entered (optional, will be stored as metadata): ").strip() or None
+                if ask_intent_per_step:
+                    desc = input("What were you trying to do? (free text, optional): ").strip()
+
+            action = Action(
+                type=action_type,
+                element_id=element_id,
+                raw_input=raw_input_val,
+                metadata={},
+            )
+
+            intent_id: Optional[str] = None
+            if ask_intent_per_step and desc:
+                intent_id = cli_resolve_intent(desc, suggest=suggest_intents)
 
-        print(
-            f"[step] recorded transition {step.transition_id!r} "
-            f"{step.source_state_id} -> {step.target_state_id}"
-        )
-        step_index += 1
+            if verbose:
+                # Let the human perform the action and then confirm
+                input("Press Enter AFTER you have performed this action in the UI...")
+
+            # Capture the new state explicitly to keep the flow obvious
+            next_state = driver.capture_state()
+
+            step = recorder.record_step(
+                action,
+                intent_id=intent_id,
+                next_state=next_state,
+            )
+
+            record = exporter.append_transition(recorder.last_transition)
+            if spool is not None:
+                spool.append(record.to_dict())
+
+            print(
+                f"[step] recorded transition {step.transition_id!r} "
+                f"{step.source_state_id} -> {step.target_state_id}"
+            )
+            step_index += 1
+    finally:
+        if spool is not None:
+            # Release the handle even if recording was interrupted; the
+            # spooled steps then stay on disk (see BundleSpool).
+            spool.close()
 
     # Export
-    exporter = build_exporter(rec_cfg, tracker)
-    bundle = exporter.build_bundle()
-
-    output_cfg = rec_cfg.get("output", {}) or {}
-    mode = (output_cfg.get("mode") or "atlas").lower()
-
-    if mode == "filesystem":
-        export_to_filesystem(bundle, rec_cfg, recorder.session_id)
+    if spool is not None:
+        export_to_filesystem(exporter, spool)
     elif mode == "atlas":
-        export_to_atlas(bundle, rec_cfg)
+        export_to_atlas(exporter.build_bundle(), rec_cfg)
     else:
         print(f"[export] unknown output.mode={mode!r}, skipping export.")
 
@@ -355,11 +508,17 @@ def main(argv: Optional[list[str]] = None) -> None:
         default=Path("config/recorder.example.yml"),
         help="Path to recorder YAML config (default: config/recorder.example.yml)",
     )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Prompt for each step field separately instead of on one line",
+    )
 
     args = parser.parse_args(argv)
 
     rec_cfg = load_config(args.config)
-    run_interactive(rec_cfg)
+    run_interactive(rec_cfg, verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,8 @@ CLI example: inspect Atlas workflows from the command line.
 This script demonstrates how to:
 
 - List workflows for a given context.
-- Show a single workflow, optionally expanding its transitions.
-- Delete a workflow by id.
+- Show one or more workflows, optionally expanding their transitions.
+- Delete one or more workflows by id.
 
 It talks directly to the Atlas HTTP API workflow endpoints exposed by
 `atlas/api/endpoints/workflows.py` and the HTTP server.
@@ -14,6 +14,7 @@ Endpoints used:
 
 - GET  /workflows?context_id=...&intent_id=...&tag=...
 - GET  /workflows/{workflow_id}?expand_transitions=true|false
+- GET  /workflows?ids=a,b,c&expand_transitions=true|false
 - DELETE /workflows/{workflow_id}
 
 This is a read/write utility for debugging and inspection, not a
@@ -25,9 +26,17 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:
+    orjson = None
 
 from consumers.sdk.client import AtlasClientConfig
 
@@ -37,7 +46,36 @@ from consumers.sdk.client import AtlasClientConfig
 # --------------------------------------------------------------------------- #
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Retry transient gateway errors and connection failures with a short
+    # exponential backoff. Only idempotent methods are retried on status codes.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared keep-alive session so consecutive requests reuse TCP/TLS connections.
+_SESSION = _build_session()
+
+# Upper bound on concurrent requests for multi-id show/delete.
+_MAX_WORKERS = 8
+
+# Connecting should be fast; a server that does not accept within this
+# many seconds is treated as down rather than waited on for the full
+# read timeout.
+_CONNECT_TIMEOUT = 2.0
+
+
 def build_headers(cfg: AtlasClientConfig) -> Dict[str, str]:
+    """Headers for every Atlas request; installed once on the shared session."""
     headers: Dict[str, str] = {
         "Accept": "application/json",
     }
@@ -55,16 +93,14 @@ def request_json(
     body: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     url = cfg.base_url.rstrip("/") + path
-    headers = build_headers(cfg)
 
     try:
-        resp = requests.request(
+        resp = _SESSION.request(
             method=method.upper(),
             url=url,
-            headers=headers,
             params=params,
             json=body,
-            timeout=cfg.timeout,
+            timeout=(min(_CONNECT_TIMEOUT, cfg.timeout), cfg.timeout),
         )
     except requests.RequestException as exc:
         raise SystemExit(f"HTTP request failed: {exc}") from exc
@@ -86,6 +122,12 @@ def request_json(
 
 
 def pretty_print(obj: Any) -> None:
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b"\n")
+        sys.stdout.buffer.flush()
+        return
     print(json.dumps(obj, indent=2, sort_keys=True))
 
 
@@ -107,17 +149,80 @@ def cmd_list(cfg: AtlasClientConfig, args: argparse.Namespace) -> None:
     pretty_print(data)
 
 
+def _for_each_workflow(
+    workflow_ids: List[str], fn: Callable[[str], Dict[str, Any]]
+) -> Any:
+    """
+    Apply `fn` to every workflow id, concurrently when there are several.
+
+    Returns the single result for one id, or a list of results in input
+    order for many.
+    """
+    if len(workflow_ids) == 1:
+        return fn(workflow_ids[0])
+
+    workers = min(_MAX_WORKERS, len(workflow_ids))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, workflow_ids))
+
+
+def _batched_workflows(
+    data: Any, workflow_ids: List[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate a GET /workflows?ids=... response.
+
+    Returns the response restricted to the requested ids, or None if it
+    does not have the batch shape ({"workflows": [{"workflow": {...}}, ...],
+    "missing": [...]}), e.g. because the server ignored `ids` and answered
+    with its plain workflow list.
+    """
+    if not isinstance(data, dict):
+        return None
+    items = data.get("workflows")
+    if not isinstance(items, list) or not isinstance(data.get("missing"), list):
+        return None
+
+    wanted = dict.fromkeys(workflow_ids)
+    found: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        workflow = item.get("workflow") if isinstance(item, dict) else None
+        if not isinstance(workflow, dict):
+            return None
+        workflow_id = workflow.get("workflow_id")
+        if workflow_id in wanted:
+            found.setdefault(workflow_id, item)
+
+    return {
+        "workflows": [found[i] for i in wanted if i in found],
+        "missing": [i for i in wanted if i not in found],
+    }
+
+
 def cmd_show(cfg: AtlasClientConfig, args: argparse.Namespace) -> None:
-    path = f"/workflows/{args.workflow_id}"
     params = {"expand_transitions": "true" if args.expand_transitions else "false"}
-    data = request_json(cfg, "GET", path, params=params)
-    pretty_print(data)
+
+    if len(args.workflow_id) > 1 and not args.no_batch:
+        # One batched request instead of one per id.
+        batch_params = dict(params, ids=",".join(args.workflow_id))
+        data = request_json(cfg, "GET", "/workflows", params=batch_params)
+        batch = _batched_workflows(data, args.workflow_id)
+        if batch is not None:
+            pretty_print(batch)
+            return
+        # Not a batch answer: fall back to one request per id.
+
+    def show_one(workflow_id: str) -> Dict[str, Any]:
+        return request_json(cfg, "GET", f"/workflows/{workflow_id}", params=params)
+
+    pretty_print(_for_each_workflow(args.workflow_id, show_one))
 
 
 def cmd_delete(cfg: AtlasClientConfig, args: argparse.Namespace) -> None:
-    path = f"/workflows/{args.workflow_id}"
-    data = request_json(cfg, "DELETE", path)
-    pretty_print(data)
+    def delete_one(workflow_id: str) -> Dict[str, Any]:
+        return request_json(cfg, "DELETE", f"/workflows/{workflow_id}")
+
+    pretty_print(_for_each_workflow(args.workflow_id, delete_one))
 
 
 # --------------------------------------------------------------------------- #
@@ -125,6 +230,69 @@ def cmd_delete(cfg: AtlasClientConfig, args: argparse.Namespace) -> None:
 # --------------------------------------------------------------------------- #
 
 
+def _add_list_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--context-id",
+        help="Filter workflows by context_id",
+    )
+    p.add_argument(
+        "--intent-id",
+        help="Filter workflows by intent_id",
+    )
+    p.add_argument(
+        "--tag",
+        help="Filter workflows by tag (case-insensitive exact match)",
+    )
+
+
+def _add_show_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "workflow_id",
+        nargs="+",
+        help="Workflow identifier(s)",
+    )
+    p.add_argument(
+        "--expand-transitions",
+        action="store_true",
+        help="Also fetch and include full TransitionRecord payloads",
+    )
+    p.add_argument(
+        "--no-batch",
+        action="store_true",
+        help=(
+            "Fetch multiple workflows with one request each instead of a "
+            "single GET /workflows?ids=... (for servers without batch support)"
+        ),
+    )
+
+
+def _add_delete_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "workflow_id",
+        nargs="+",
+        help="Workflow identifier(s)",
+    )
+
+
+# name -> (help, argument registration, handler)
+_SUBCOMMANDS: Dict[
+    str,
+    Tuple[
+        str,
+        Callable[[argparse.ArgumentParser], None],
+        Callable[[AtlasClientConfig, argparse.Namespace], None],
+    ],
+] = {
+    "list": (
+        "List workflows (optionally filtered by context/intent/tag)",
+        _add_list_args,
+        cmd_list,
+    ),
+    "show": ("Show one or more workflows by id", _add_show_args, cmd_show),
+    "delete": ("Delete one or more workflows by id", _add_delete_args, cmd_delete),
+}
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="CLI example: inspect Ariane Atlas workflows."
@@ -148,48 +316,10 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # list
-    p_list = subparsers.add_parser(
-        "list", help="List workflows (optionally filtered by context/intent/tag)"
-    )
-    p_list.add_argument(
-        "--context-id",
-        help="Filter workflows by context_id",
-    )
-    p_list.add_argument(
-        "--intent-id",
-        help="Filter workflows by intent_id",
-    )
-    p_list.add_argument(
-        "--tag",
-        help="Filter workflows by tag (case-insensitive exact match)",
-    )
-    p_list.set_defaults(func=cmd_list)
-
-    # show
-    p_show = subparsers.add_parser(
-        "show", help="Show a single workflow by id"
-    )
-    p_show.add_argument(
-        "workflow_id",
-        help="Workflow identifier",
-    )
-    p_show.add_argument(
-        "--expand-transitions",
-        action="store_true",
-        help="Also fetch and include full TransitionRecord payloads",
-    )
-    p_show.set_defaults(func=cmd_show)
-
-    # delete
-    p_delete = subparsers.add_parser(
-        "delete", help="Delete a workflow by id"
-    )
-    p_delete.add_argument(
-        "workflow_id",
-        help="Workflow identifier",
-    )
-    p_delete.set_defaults(func=cmd_delete)
+    for name, (help_text, add_args, handler) in _SUBCOMMANDS.items():
+        p = subparsers.add_parser(name, help=help_text)
+        add_args(p)
+        p.set_defaults(func=handler)
 
     return parser
 
@@ -204,6 +334,7 @@ def main(argv: Optional[list[str]] = None) -> None:
         api_key_header="X-API-Key",
         timeout=args.timeout,
     )
+    _SESSION.headers.update(build_headers(cfg))
 
     func = getattr(args, "func", None)
     if func is None:
@@ -12,39 +12,48 @@ Ariane's Guidance Client:
 This package does NOT perform any UI rendering or direct user I/O.
 Presentation layers (CLI tools, GUIs, overlays, etc.) should import
 and consume these primitives.
+
+Submodules are imported lazily (PEP 562): `from consumers.guidance import
+LocalUISnapshot` loads only what that name needs, so tools that touch a
+single primitive do not pay for importing the engine and its SDK client.
 """
 
-from .models import (
-    GoalType,
-    GuidanceGoal,
-    StateMatchDetails,
-    StateMatchResult,
-    GuidanceStepKind,
-    GuidanceStep,
-    GuidancePlanStatus,
-    GuidancePlan,
-    SessionStatus,
-    GuidanceSessionState,
-)
-from .probe_interface import (
-    ProbingError,
-    BoundingBoxSnapshot,
-    LocalElementSnapshot,
-    LocalUISnapshot,
-    GuidanceProbe,
-    NullProbe,
-)
-from .matching import (
-    MatchingConfig,
-    score_state_match,
-    match_states,
-    best_match,
-)
-from .engine import (
-    GuidanceEngineError,
-    GuidanceEngineConfig,
-    GuidanceEngine,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .models import (
+        GoalType,
+        GuidanceGoal,
+        StateMatchDetails,
+        StateMatchResult,
+        GuidanceStepKind,
+        GuidanceStep,
+        GuidancePlanStatus,
+        GuidancePlan,
+        SessionStatus,
+        GuidanceSessionState,
+    )
+    from .probe_interface import (
+        ProbingError,
+        BoundingBoxSnapshot,
+        LocalElementSnapshot,
+        LocalUISnapshot,
+        GuidanceProbe,
+        NullProbe,
+    )
+    from .matching import (
+        MatchingConfig,
+        score_state_match,
+        match_states,
+        best_match,
+    )
+    from .engine import (
+        GuidanceEngineError,
+        GuidanceEngineConfig,
+        GuidanceEngine,
+    )
+
 
 __all__ = [
     # models
@@ -75,3 +84,48 @@ __all__ = [
     "GuidanceEngineConfig",
     "GuidanceEngine",
 ]
+
+
+# Public name -> defining submodule.
+_LAZY_SUBMODULES: Dict[str, str] = {
+    # models
+    "GoalType": "models",
+    "GuidanceGoal": "models",
+    "StateMatchDetails": "models",
+    "StateMatchResult": "models",
+    "GuidanceStepKind": "models",
+    "GuidanceStep": "models",
+    "GuidancePlanStatus": "models",
+    "GuidancePlan": "models",
+    "SessionStatus": "models",
+    "GuidanceSessionState": "models",
+    # probe_interface
+    "ProbingError": "probe_interface",
+    "BoundingBoxSnapshot": "probe_interface",
+    "LocalElementSnapshot": "probe_interface",
+    "LocalUISnapshot": "probe_interface",
+    "GuidanceProbe": "probe_interface",
+    "NullProbe": "probe_interface",
+    # matching
+    "MatchingConfig": "matching",
+    "score_state_match": "matching",
+    "match_states": "matching",
+    "best_match": "matching",
+    # engine
+    "GuidanceEngineError": "engine",
+    "GuidanceEngineConfig": "engine",
+    "GuidanceEngine": "engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_SUBMODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
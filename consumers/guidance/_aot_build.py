@@ -0,0 +1,57 @@
+"""
+Ahead-of-time build of the matching kernels.
+
+Compiles `_matching_kernels.score_rows_impl` with Numba's AOT compiler into
+a `_matching_kernels_aot` extension module next to this file. When that
+extension is importable, `_matching_kernels` uses it instead of JIT
+compiling the kernel on first use, so short-lived guidance processes do
+not pay the compile cost.
+
+Usage (requires NumPy, Numba and a C compiler):
+
+    python -m consumers.guidance._aot_build
+
+The extension is platform-specific and is not committed; rebuild it after
+changing the kernel. Without it, the JIT / NumPy / pure-Python paths are
+used as before.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+def build(output_dir: Path = Path(__file__).resolve().parent) -> Path:
+    """Compile the extension into `output_dir` and return its path."""
+    try:
+        from numba.pycc import CC
+    except ImportError as exc:
+        raise RuntimeError("Numba (with numba.pycc) is required for the AOT build") from exc
+
+    from consumers.guidance._matching_kernels import SCORE_ROWS_SIGNATURE, score_rows_impl
+
+    cc = CC("_matching_kernels_aot")
+    cc.output_dir = str(output_dir)
+    cc.verbose = False
+    cc.export("score_rows", SCORE_ROWS_SIGNATURE)(score_rows_impl)
+    cc.compile()
+
+    built = sorted(output_dir.glob("_matching_kernels_aot*"))
+    if not built:
+        raise RuntimeError("AOT build did not produce an extension module")
+    return built[-1]
+
+
+def main() -> int:
+    try:
+        path = build()
+    except RuntimeError as exc:
+        print(f"[error] {exc}", file=sys.stderr)
+        return 1
+    print(f"Built {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,334 @@
+"""
+Batch scoring kernels for state matching.
+
+This is an internal helper for `consumers.guidance.matching`. A set of
+candidate states is encoded once into integer arrays:
+
+- `codes[i, k]`: id of state i's value for fingerprint key k
+  (0 = key absent). Ids come from a value vocabulary, so equal codes
+  mean equal values; there are no hash collisions.
+- `visual[i]`: code of state i's "visual" fingerprint, or 0 if the
+  value is absent or empty; `visual_bits[i]` / `visual_parsed[i]` hold
+  its 64-bit SimHash value when it parses as one.
+- `postings[token]`: indices of the states whose label tokens contain
+  `token` (an inverted index), plus `token_counts[i]`.
+- `token_indptr` / `token_indices`: the same tokens as sorted integer
+  ids per state (CSR layout), for the compiled kernel.
+
+Scoring a snapshot against the encoded candidates is then a handful of
+vectorized NumPy operations instead of one Python call per state. If
+Numba is also installed (or the `_matching_kernels_aot` extension has
+been built with `_aot_build.py`), a single compiled pass over the rows is
+used instead, which avoids the (N, K) temporaries. The arithmetic
+mirrors the scalar path in `matching.py` operation for operation, so
+every path produces bit-identical scores.
+
+NumPy and Numba are optional. Without NumPy `encode()` returns None and
+callers keep using the scalar path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Sequence
+
+try:  # Optional acceleration
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+    prange = range
+
+
+# Below this many candidates the scalar loop is faster than encoding the
+# snapshot and dispatching into NumPy.
+_VECTOR_MIN_SIZE = 64
+
+# From this many candidates the JIT kernel spreads rows over threads; below
+# it, thread start-up costs more than it saves.
+_PARALLEL_MIN_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class EncodedCandidates:
+    """Integer-coded view of a fixed candidate list (see module docstring)."""
+
+    key_to_col: Dict[str, int]
+    value_ids: Dict[Any, int]
+    codes: Any
+    visual: Any
+    visual_bits: Any
+    visual_parsed: Any
+    postings: Dict[str, Any]
+    token_counts: Any
+    token_ids: Dict[str, int]
+    token_indptr: Any
+    token_indices: Any
+
+    def __len__(self) -> int:
+        return len(self.visual)
+
+
+def encode(
+    fps_list: Sequence[Mapping[str, str]],
+    token_sets: Sequence[AbstractSet[str]],
+    visual_bits: Sequence[Optional[int]],
+) -> Optional[EncodedCandidates]:
+    """
+    Encode candidate fingerprints and label tokens for batch scoring.
+
+    Returns None when NumPy is unavailable or the candidate list is too
+    small for vectorization to pay off.
+    """
+    n = len(fps_list)
+    if np is None or n < _VECTOR_MIN_SIZE:
+        return None
+
+    key_to_col: Dict[str, int] = {}
+    value_ids: Dict[Any, int] = {}
+    for fps in fps_list:
+        for key, value in fps.items():
+            key_to_col.setdefault(key, len(key_to_col))
+            value_ids.setdefault(value, len(value_ids) + 1)
+
+    codes = np.zeros((n, len(key_to_col)), dtype=np.int32)
+    visual = np.zeros(n, dtype=np.int32)
+    for i, fps in enumerate(fps_list):
+        row = codes[i]
+        for key, value in fps.items():
+            row[key_to_col[key]] = value_ids[value]
+        vis = fps.get("visual")
+        if vis:
+            visual[i] = value_ids[vis]
+
+    visual_parsed = np.fromiter(
+        (b is not None for b in visual_bits), dtype=np.bool_, count=n
+    )
+    bits = np.fromiter(
+        (0 if b is None else b for b in visual_bits), dtype=np.uint64, count=n
+    )
+
+    index: Dict[str, List[int]] = {}
+    token_ids: Dict[str, int] = {}
+    flat: List[int] = []
+    for i, tokens in enumerate(token_sets):
+        for token in tokens:
+            index.setdefault(token, []).append(i)
+        flat.extend(sorted(token_ids.setdefault(t, len(token_ids)) for t in tokens))
+    postings = {t: np.array(rows, dtype=np.int32) for t, rows in index.items()}
+    token_counts = np.fromiter((len(t) for t in token_sets), dtype=np.int64, count=n)
+    token_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(token_counts, out=token_indptr[1:])
+
+    return EncodedCandidates(
+        key_to_col=key_to_col,
+        value_ids=value_ids,
+        codes=codes,
+        visual=visual,
+        visual_bits=bits,
+        visual_parsed=visual_parsed,
+        postings=postings,
+        token_counts=token_counts,
+        token_ids=token_ids,
+        token_indptr=token_indptr,
+        token_indices=np.array(flat, dtype=np.int32),
+    )
+
+
+def rank(
+    enc: EncodedCandidates,
+    snap_fps: Mapping[str, str],
+    snap_tokens: AbstractSet[str],
+    *,
+    structural_weight: float,
+    semantic_weight: float,
+    visual_weight: float,
+    min_score: float,
+    require_fingerprint_overlap: bool,
+    visual_simhash: bool = False,
+    snap_visual_bits: Optional[int] = None,
+) -> List[int]:
+    """
+    Score every encoded candidate against a snapshot.
+
+    Returns:
+        Indices of the candidates that pass `min_score` (and the overlap
+        requirement), ordered by descending combined score. Ties keep
+        candidate order, matching a stable descending sort.
+    """
+    n = len(enc)
+    total_weight = structural_weight + semantic_weight + visual_weight
+    if n == 0 or total_weight <= 0.0:
+        return []
+
+    # Structural: -1 never equals a stored code, so snapshot values that
+    # no candidate has still count towards overlap but never as hits.
+    value_ids = enc.value_ids
+    snap_row = np.full(enc.codes.shape[1], -1, dtype=np.int32)
+    cols: List[int] = []
+    for key, value in snap_fps.items():
+        col = enc.key_to_col.get(key)
+        if col is not None:
+            cols.append(col)
+            snap_row[col] = value_ids.get(value, -1)
+    # Visual: exact match of non-empty "visual" fingerprints, or SimHash
+    # similarity where both sides parse as 64-bit values.
+    snap_vis = snap_fps.get("visual")
+    if snap_vis:
+        visual = (enc.visual == value_ids.get(snap_vis, -1)).astype(np.float64)
+        if visual_simhash and snap_visual_bits is not None:
+            diff = enc.visual_bits ^ np.uint64(snap_visual_bits)
+            simhash = 1.0 - _popcount(diff) / 64.0
+            visual = np.where(enc.visual_parsed, simhash, visual)
+    else:
+        visual = np.zeros(n)
+
+    score_rows = _score_rows
+    if _score_rows_parallel is not None and n >= _PARALLEL_MIN_SIZE:
+        score_rows = _score_rows_parallel
+    if score_rows is not None:
+        snap_tok = np.array(
+            sorted(enc.token_ids[t] for t in snap_tokens if t in enc.token_ids),
+            dtype=np.int32,
+        )
+        combined, overlap = score_rows(
+            enc.codes,
+            snap_row,
+            np.array(cols, dtype=np.int64),
+            visual,
+            enc.token_indptr,
+            enc.token_indices,
+            snap_tok,
+            len(snap_tokens),
+            float(structural_weight),
+            float(semantic_weight),
+            float(visual_weight),
+            float(total_weight),
+        )
+        return _select(combined, overlap, min_score, require_fingerprint_overlap)
+
+    overlap = (enc.codes[:, cols] != 0).sum(axis=1)
+    hits = (enc.codes == snap_row).sum(axis=1)
+    structural = np.zeros(n)
+    np.divide(hits, overlap, out=structural, where=overlap > 0)
+
+    # Semantic: token intersections via the inverted index, then Jaccard.
+    semantic = np.zeros(n)
+    if snap_tokens:
+        lists = [enc.postings[t] for t in snap_tokens if t in enc.postings]
+        if lists:
+            inter = np.bincount(np.concatenate(lists), minlength=n)
+            union = len(snap_tokens) + enc.token_counts - inter
+            np.divide(inter, union, out=semantic, where=enc.token_counts > 0)
+
+    combined = (
+        structural * structural_weight
+        + semantic * semantic_weight
+        + visual * visual_weight
+    ) / total_weight
+    return _select(combined, overlap, min_score, require_fingerprint_overlap)
+
+
+def _popcount(values: Any) -> Any:
+    """Per-element set-bit count of a uint64 array, as float64."""
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(values).astype(np.float64)
+    as_bytes = values.view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1).astype(np.float64)
+
+
+def _select(
+    combined: Any, overlap: Any, min_score: float, require_fingerprint_overlap: bool
+) -> List[int]:
+    keep = combined >= min_score
+    if require_fingerprint_overlap:
+        keep &= overlap > 0
+    idx = np.flatnonzero(keep)
+    order = np.argsort(-combined[idx], kind="stable")
+    return idx[order].tolist()
+
+
+# Row-scoring kernel, written in the Numba-compatible subset of Python. It
+# is compiled on first use with @njit, or ahead of time into the
+# `_matching_kernels_aot` extension by `_aot_build.py`; only arrays and
+# scalars cross the boundary. Rows are independent, so the outer loop is a
+# `prange`: the parallel JIT build splits it over threads, every other
+# build runs it as a plain range, and the scores are the same either way.
+def score_rows_impl(
+    codes,
+    snap_row,
+    cols,
+    visual,
+    indptr,
+    tokens,
+    snap_tok,
+    n_snap_tokens,
+    ws,
+    wsem,
+    wv,
+    total,
+):
+    n = codes.shape[0]
+    combined = np.empty(n, dtype=np.float64)
+    overlap = np.empty(n, dtype=np.int64)
+    m = snap_tok.shape[0]
+    for i in prange(n):
+        cnt = 0
+        hit = 0
+        # Stored codes are >= 0 and snapshot codes are >= 1 or -1, so a
+        # hit implies a != 0 and both counters can be accumulated
+        # without branches.
+        for c in cols:
+            a = codes[i, c]
+            cnt += a != 0
+            hit += a == snap_row[c]
+        structural = hit / cnt if cnt > 0 else 0.0
+
+        # Merge-intersect the sorted token ids of row i and the snapshot.
+        lo = indptr[i]
+        hi = indptr[i + 1]
+        semantic = 0.0
+        if n_snap_tokens > 0 and hi > lo:
+            inter = 0
+            p = lo
+            q = 0
+            while p < hi and q < m:
+                x = tokens[p]
+                y = snap_tok[q]
+                inter += x == y
+                p += x <= y
+                q += y <= x
+            semantic = inter / (n_snap_tokens + (hi - lo) - inter)
+
+        combined[i] = (structural * ws + semantic * wsem + visual[i] * wv) / total
+        overlap[i] = cnt
+    return combined, overlap
+
+
+# Signature used for the ahead-of-time build; see `_aot_build.py`.
+SCORE_ROWS_SIGNATURE = (
+    "Tuple((f8[::1], i8[::1]))("
+    "i4[:, ::1], i4[::1], i8[::1], f8[::1], i8[::1], i4[::1], i4[::1],"
+    " i8, f8, f8, f8, f8)"
+)
+
+try:  # Prebuilt extension: no JIT compilation at runtime.
+    from consumers.guidance._matching_kernels_aot import (  # type: ignore[import-not-found]
+        score_rows as _score_rows,
+    )
+except ImportError:
+    if njit is not None and np is not None:
+        _score_rows = njit(cache=True)(score_rows_impl)
+    else:
+        _score_rows = None
+
+# Multi-threaded variant for very large candidate sets (JIT only; compiled
+# lazily on the first call that reaches _PARALLEL_MIN_SIZE).
+if njit is not None and np is not None:
+    _score_rows_parallel = njit(cache=True, parallel=True)(score_rows_impl)
+else:
+    _score_rows_parallel = None
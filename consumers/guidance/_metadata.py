@@ -0,0 +1,42 @@
+"""
+Shared empty metadata for high-volume guidance models.
+
+`LocalElementSnapshot` and `GuidanceStep` are created in large numbers
+and almost always carry no metadata. Instead of a fresh empty dict per
+instance, their `metadata` defaults to the read-only `EMPTY_METADATA`
+singleton (via `field(default_factory=empty_metadata)`). It is a real
+(empty) dict, so `isinstance(..., dict)`, `dict(...)`, `json.dumps` and
+pickling keep working, but in-place mutation raises TypeError: assign a
+new dict to add metadata.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, NoReturn
+
+
+class _EmptyMetadata(Dict[str, Any]):
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(
+            "default metadata is shared and read-only; assign a new dict instead"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> str:
+        # Unpickle to the module-level singleton.
+        return "EMPTY_METADATA"
+
+    def __repr__(self) -> str:
+        return "{}"
+
+
+EMPTY_METADATA: Dict[str, Any] = _EmptyMetadata()
+
+
+def empty_metadata() -> Dict[str, Any]:
+    """default_factory returning the shared `EMPTY_METADATA`."""
+    return EMPTY_METADATA
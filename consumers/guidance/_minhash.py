@@ -0,0 +1,73 @@
+"""
+MinHash / LSH index over label token sets.
+
+This is an internal helper for `consumers.guidance.matching`. Each
+candidate's token set is summarized by a MinHash signature, and the
+signatures are split into bands that are bucketed in plain dicts. A query
+returns the candidates that share at least one band bucket with the query
+signature, i.e. those whose token sets are likely to have a Jaccard
+similarity above roughly (1 / bands) ** (1 / rows).
+
+Token hashes use the built-in `hash()`, so an index is only meaningful
+within the process that built it.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import AbstractSet, Dict, List, Optional, Sequence, Set, Tuple
+
+# Mersenne prime used as the modulus of the universal hash family.
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 61) - 1
+
+# 32 bands x 2 rows: candidate pairs are found from a Jaccard
+# similarity of roughly 0.18, favouring recall over pruning.
+_BANDS = 32
+_ROWS = 2
+
+_rng = random.Random(0x5EED)
+_PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME))
+    for _ in range(_BANDS * _ROWS)
+)
+
+
+def signature(tokens: AbstractSet[str]) -> Optional[Tuple[int, ...]]:
+    """Return the MinHash signature of a token set, or None if it is empty."""
+    if not tokens:
+        return None
+    hashes = [hash(t) & _MASK for t in tokens]
+    return tuple(
+        min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS
+    )
+
+
+def _bands(sig: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+    return [(i, sig[i * _ROWS : (i + 1) * _ROWS]) for i in range(_BANDS)]
+
+
+class MinHashIndex:
+    """Banded LSH index from token sets to candidate positions."""
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self, token_sets: Sequence[AbstractSet[str]]) -> None:
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for pos, tokens in enumerate(token_sets):
+            sig = signature(tokens)
+            if sig is None:
+                continue
+            for band in _bands(sig):
+                buckets.setdefault(band, []).append(pos)
+        self._buckets = buckets
+
+    def query(self, tokens: AbstractSet[str]) -> Set[int]:
+        """Return positions of candidates sharing a band with `tokens`."""
+        sig = signature(tokens)
+        if sig is None:
+            return set()
+        found: Set[int] = set()
+        for band in _bands(sig):
+            found.update(self._buckets.get(band, ()))
+        return found
@@ -30,10 +30,17 @@ the GuidanceStep objects it produces.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
-
-from consumers.guidance.matching import MatchingConfig, best_match
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from consumers.guidance.matching import (
+    MatchingConfig,
+    PreparedCandidates,
+    best_match,
+    prepare_candidates,
+)
 from consumers.guidance.models import (
     GoalType,
     GuidanceGoal,
@@ -42,12 +49,19 @@ from consumers.guidance.models import (
     GuidanceSessionState,
     GuidanceStep,
     GuidanceStepKind,
+    LazyStepList,
     SessionStatus,
     StateMatchResult,
 )
 from consumers.guidance.probe_interface import GuidanceProbe, LocalUISnapshot, ProbingError
 from consumers.sdk.client import AtlasClient
-from consumers.sdk.types import PathView, StateView, TransitionView, UIElementHint
+from consumers.sdk.types import (
+    ContextInfo,
+    PathView,
+    StateView,
+    TransitionView,
+    UIElementHint,
+)
 
 
 class GuidanceEngineError(Exception):
@@ -66,10 +80,15 @@ class GuidanceEngineConfig:
         Controls how snapshots are matched to known states.
     - max_path_depth:
         Optional bound for shortest_path queries into Atlas.
+    - states_cache_ttl:
+        Seconds to reuse a context's state list from Atlas before
+        listing it again. 0 (the default) disables caching; use
+        GuidanceEngine.invalidate_states() after the map changes.
     """
 
     matching_config: MatchingConfig = field(default_factory=MatchingConfig)
     max_path_depth: Optional[int] = None
+    states_cache_ttl: float = 0.0
 
 
 @dataclass
@@ -100,6 +119,16 @@ class GuidanceEngine:
     probe: GuidanceProbe
     config: GuidanceEngineConfig = field(default_factory=GuidanceEngineConfig)
 
+    # context_id -> candidates prepared from the last state list seen for
+    # that context; reused while the same StateView objects come back.
+    _prepared: Dict[str, PreparedCandidates] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # context_id -> (monotonic fetch time, states); see states_cache_ttl.
+    _states_cache: Dict[str, Tuple[float, List[StateView]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     # ------------------------------------------------------------------ #
     # State resolution
     # ------------------------------------------------------------------ #
@@ -109,6 +138,8 @@ class GuidanceEngine:
         context_id: str,
         snapshot: Optional[LocalUISnapshot] = None,
         min_score: Optional[float] = None,
+        *,
+        states: Optional[Sequence[StateView]] = None,
     ) -> Optional[StateMatchResult]:
         """
         Capture (or accept) a snapshot and resolve it to a StateView.
@@ -120,6 +151,9 @@ class GuidanceEngine:
                 Optional LocalUISnapshot; if None, capture from probe.
             min_score:
                 Optional minimum score override for best_match.
+            states:
+                Optional candidate states already fetched for this
+                context; if None, they are listed from Atlas.
 
         Returns:
             StateMatchResult for the best candidate, or None if no
@@ -128,21 +162,68 @@ class GuidanceEngine:
         if snapshot is None:
             snapshot = self.probe.capture_snapshot()
 
-        # Fetch candidate states from Atlas.
-        states = self.client.list_states(context_id)
+        # Fetch candidate states from Atlas unless the caller has them.
+        # Preparing candidates only pays off when the same list is matched
+        # again (a cached or caller-held list); a fresh listing is scored
+        # directly.
+        reused = states is not None or self.config.states_cache_ttl > 0
+        if states is None:
+            states = self._list_states(context_id)
 
         if not states:
             return None
 
+        candidates: Union[Sequence[StateView], PreparedCandidates] = states
+        if reused:
+            candidates = self._prepared_candidates(context_id, states)
+
         # Use matching logic to pick the best candidate.
         match = best_match(
             snapshot=snapshot,
-            candidates=states,
+            candidates=candidates,
             config=self.config.matching_config,
             min_score=min_score,
         )
         return match
 
+    def _list_states(self, context_id: str) -> List[StateView]:
+        """List a context's states, reusing a recent result if caching is on."""
+        ttl = self.config.states_cache_ttl
+        if ttl <= 0:
+            return self.client.list_states(context_id)
+
+        now = time.monotonic()
+        cached = self._states_cache.get(context_id)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        states = self.client.list_states(context_id)
+        self._states_cache[context_id] = (now, states)
+        return states
+
+    def invalidate_states(self, context_id: Optional[str] = None) -> None:
+        """
+        Drop cached state lists (and their match preparations).
+
+        Call after the Atlas map changes, e.g. after ingesting a bundle.
+        With no argument, every context is invalidated.
+        """
+        if context_id is None:
+            self._states_cache.clear()
+            self._prepared.clear()
+        else:
+            self._states_cache.pop(context_id, None)
+            self._prepared.pop(context_id, None)
+
+    def _prepared_candidates(
+        self, context_id: str, states: Sequence[StateView]
+    ) -> PreparedCandidates:
+        """Return match-ready candidates for `states`, reusing the last preparation."""
+        prepared = self._prepared.get(context_id)
+        if prepared is None or not prepared.is_for(states):
+            prepared = prepare_candidates(states)
+            self._prepared[context_id] = prepared
+        return prepared
+
     # ------------------------------------------------------------------ #
     # Plan construction
     # ------------------------------------------------------------------ #
@@ -152,6 +233,10 @@ class GuidanceEngine:
         context_id: str,
         goal: GuidanceGoal,
         snapshot: Optional[LocalUISnapshot] = None,
+        *,
+        context: Optional[ContextInfo] = None,
+        states: Optional[Sequence[StateView]] = None,
+        match: Optional[StateMatchResult] = None,
     ) -> GuidancePlan:
         """
         Build a GuidancePlan from the current UI state towards a goal.
@@ -173,20 +258,31 @@ class GuidanceEngine:
                 GuidanceGoal describing user intent.
             snapshot:
                 Optional LocalUISnapshot; if None, capture from probe.
+            context:
+                Optional ContextInfo already fetched for `context_id`;
+                skips the existence check round-trip.
+            states:
+                Optional candidate states already fetched for this
+                context (see resolve_current_state).
+            match:
+                Optional current-state match already resolved by the
+                caller; skips snapshot capture and matching.
 
         Returns:
             GuidancePlan (status READY, PARTIAL, or FAILED).
         """
         # Sanity check: ensure context exists.
-        ctx = self.client.get_context(context_id)
+        ctx = context if context is not None else self.client.get_context(context_id)
         if ctx is None:
             raise GuidanceEngineError(f"Context '{context_id}' not found")
 
         # Resolve current state.
-        if snapshot is None:
-            snapshot = self.probe.capture_snapshot()
-
-        match = self.resolve_current_state(context_id, snapshot=snapshot)
+        if match is None:
+            if snapshot is None:
+                snapshot = self.probe.capture_snapshot()
+            match = self.resolve_current_state(
+                context_id, snapshot=snapshot, states=states
+            )
         if match is None:
             # No match found: produce a FAILED plan with an error step.
             empty_goal = goal
@@ -224,7 +320,7 @@ class GuidanceEngine:
         target_state_id: Optional[str] = None
         plan_status: GuidancePlanStatus
         path_view: Optional[PathView] = None
-        steps: list[GuidanceStep] = []
+        steps: Sequence[GuidanceStep] = []
 
         if goal.goal_type == GoalType.TARGET_STATE:
             if not goal.target_state_id:
@@ -249,7 +345,7 @@ class GuidanceEngine:
                 "An external component must map the goal to a target state and "
                 "rebuild the plan."
             )
-            steps.append(
+            steps = [
                 GuidanceStep(
                     step_index=0,
                     step_count=1,
@@ -261,7 +357,7 @@ class GuidanceEngine:
                     notes="INTENT/WORKFLOW resolution not implemented.",
                     blocking=False,
                 )
-            )
+            ]
 
         else:
             raise GuidanceEngineError(f"Unsupported goal_type: {goal.goal_type}")
@@ -287,7 +383,7 @@ class GuidanceEngine:
         source_state_id: str,
         target_state_id: str,
         goal: GuidanceGoal,
-    ) -> tuple[GuidancePlanStatus, Optional[PathView], list[GuidanceStep]]:
+    ) -> tuple[GuidancePlanStatus, Optional[PathView], Sequence[GuidanceStep]]:
         """
         Internal helper to query Atlas for a path and convert it into
         GuidanceStep objects.
@@ -338,20 +434,19 @@ class GuidanceEngine:
             ]
             return GuidancePlanStatus.FAILED, path_view, steps
 
-        # Build ACTION steps from transitions.
-        steps: list[GuidanceStep] = []
-        total_steps = len(path_view.transitions)
+        # ACTION steps are built from transitions as they are first read.
+        transitions = path_view.transitions
+        total_steps = len(transitions)
 
-        for idx, tr in enumerate(path_view.transitions):
-            step = self._transition_to_step(
+        def make_step(idx: int) -> GuidanceStep:
+            return self._transition_to_step(
                 context_id=context_id,
-                transition_view=tr,
+                transition_view=transitions[idx],
                 step_index=idx,
                 step_count=total_steps,
             )
-            steps.append(step)
 
-        return GuidancePlanStatus.READY, path_view, steps
+        return GuidancePlanStatus.READY, path_view, LazyStepList(total_steps, make_step)
 
     def _transition_to_step(
         self,
@@ -407,22 +502,40 @@ class GuidanceEngine:
         context_id: str,
         goal: GuidanceGoal,
         snapshot: Optional[LocalUISnapshot] = None,
+        *,
+        context: Optional[ContextInfo] = None,
+        states: Optional[Sequence[StateView]] = None,
     ) -> GuidanceSessionState:
         """
         Build a guidance plan and wrap it in a GuidanceSessionState.
 
         The session starts at step 0 if the plan has actionable steps
         and status READY; otherwise, the session is immediately in a
-        terminal state (COMPLETED/FAILED) based on the plan.
+        terminal state (COMPLETED/FAILED) based on the plan. A
+        TARGET_STATE goal whose target is the matched current state
+        yields a COMPLETED session without any path lookup.
+
+        `context` and `states` may be passed when the caller has already
+        fetched them from Atlas; otherwise states are listed once here.
+        The current state is resolved once and handed to build_plan, so
+        the session and the plan always agree on it.
         """
         if snapshot is None:
             snapshot = self.probe.capture_snapshot()
+        if states is None:
+            states = self._list_states(context_id)
 
-        match = self.resolve_current_state(context_id, snapshot=snapshot)
-        # Note: build_plan will recompute resolve_current_state internally
-        # if we pass snapshot=None. To keep the session state aligned
-        # with the plan's initial metadata, we use the same snapshot.
-        plan = self.build_plan(context_id=context_id, goal=goal, snapshot=snapshot)
+        match = self.resolve_current_state(context_id, snapshot=snapshot, states=states)
+        # With no match, build_plan retries resolution against the same
+        # states and snapshot and produces the FAILED plan.
+        plan = self.build_plan(
+            context_id=context_id,
+            goal=goal,
+            snapshot=snapshot,
+            context=context,
+            states=states,
+            match=match,
+        )
 
         if match is None:
             # Already handled as FAILED in build_plan, but we keep session
@@ -432,7 +545,16 @@ class GuidanceEngine:
             current_step_index = -1
         else:
             current_state_view = match.state
-            if plan.status == GuidancePlanStatus.READY and plan.steps:
+            if (
+                plan.status == GuidancePlanStatus.READY
+                and goal.goal_type == GoalType.TARGET_STATE
+                and plan.source_state_id == plan.target_state_id
+            ):
+                # Already at the target: the plan holds a single COMPLETE
+                # step and no path was requested, so there is nothing to walk.
+                session_status = SessionStatus.COMPLETED
+                current_step_index = -1
+            elif plan.status == GuidancePlanStatus.READY and plan.steps:
                 session_status = SessionStatus.RUNNING
                 current_step_index = 0
             elif plan.status == GuidancePlanStatus.READY and not plan.steps:
@@ -457,6 +579,51 @@ class GuidanceEngine:
         )
         return session
 
+    async def start_session_async(
+        self,
+        context_id: str,
+        goal: GuidanceGoal,
+        snapshot: Optional[LocalUISnapshot] = None,
+        *,
+        context: Optional[ContextInfo] = None,
+        states: Optional[Sequence[StateView]] = None,
+    ) -> GuidanceSessionState:
+        """
+        Async variant of start_session.
+
+        The probe snapshot, the context lookup and the state listing are
+        independent, so whichever of them the caller did not supply run
+        concurrently in worker threads. Matching and plan construction
+        then run through start_session in a worker thread as well, so the
+        event loop is never blocked on probe or Atlas I/O.
+        """
+
+        async def _given(value: Any) -> Any:
+            return value
+
+        snapshot, context, states = await asyncio.gather(
+            _given(snapshot)
+            if snapshot is not None
+            else asyncio.to_thread(self.probe.capture_snapshot),
+            _given(context)
+            if context is not None
+            else asyncio.to_thread(self.client.get_context, context_id),
+            _given(states)
+            if states is not None
+            else asyncio.to_thread(self._list_states, context_id),
+        )
+        if context is None:
+            raise GuidanceEngineError(f"Context '{context_id}' not found")
+
+        return await asyncio.to_thread(
+            self.start_session,
+            context_id,
+            goal,
+            snapshot,
+            context=context,
+            states=states,
+        )
+
     def advance_session(
         self,
         session: GuidanceSessionState,
@@ -470,6 +637,9 @@ class GuidanceEngine:
         - It does not re-validate that the user performed the previous
           step correctly.
         - It does not recompute the current state from a new snapshot.
+        - It makes no Atlas requests: every step already carries the
+          TransitionView hydrated by the single shortest_path call made
+          when the plan was built.
 
         Those behaviors can be layered on top in more advanced
         session controllers.
@@ -483,7 +653,9 @@ class GuidanceEngine:
 
         Returns:
             A new GuidanceSessionState (sessions are treated as immutable
-            from the engine's perspective).
+            from the engine's perspective). The new session shares its
+            `metadata` dict with `session`; copy it before making changes
+            that should not be visible through earlier sessions.
         """
         if session.is_finished():
             return session
@@ -499,28 +671,18 @@ class GuidanceEngine:
 
         next_index = session.current_step_index + 1
         if next_index >= len(session.plan.steps):
-            # No more steps; mark as completed if not already terminal.
-            new_status = (
-                session.status
-                if session.is_finished()
-                else SessionStatus.COMPLETED
-            )
-            return GuidanceSessionState(
-                context_id=session.context_id,
-                plan=session.plan,
-                current_step_index=session.current_step_index,
+            # No more steps; mark as completed (the session is not
+            # terminal here, see the is_finished() check above).
+            return replace(
+                session,
                 current_state=new_current_state,
-                status=new_status,
-                metadata=dict(session.metadata),
+                status=SessionStatus.COMPLETED,
             )
 
-        return GuidanceSessionState(
-            context_id=session.context_id,
-            plan=session.plan,
+        return replace(
+            session,
             current_step_index=next_index,
             current_state=new_current_state,
-            status=session.status,
-            metadata=dict(session.metadata),
         )
 
 
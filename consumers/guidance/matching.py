@@ -11,15 +11,33 @@ likely correspond to?” and provide a normalized confidence score.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Sized,
+    Tuple,
+    Union,
+)
 
+from consumers.guidance import _matching_kernels
+from consumers.guidance._minhash import MinHashIndex
 from consumers.guidance.models import (
     StateMatchDetails,
     StateMatchResult,
 )
 from consumers.guidance.probe_interface import LocalUISnapshot
-from consumers.sdk.types import StateView, UIElementHint
+from consumers.sdk.types import StateView
 
 
 # --------------------------------------------------------------------------- #
@@ -27,7 +45,7 @@ from consumers.sdk.types import StateView, UIElementHint
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchingConfig:
     """
     Configuration for state matching.
@@ -36,6 +54,7 @@ class MatchingConfig:
     a weighted average of the individual components.
 
     The default configuration is intentionally simple and conservative.
+    Configs are immutable; use `dataclasses.replace` to derive variants.
     """
 
     # Relative weight of each score component.
@@ -51,6 +70,40 @@ class MatchingConfig:
     # between snapshot and candidate state to consider it at all.
     require_fingerprint_overlap: bool = False
 
+    # When True, large PreparedCandidates lists that are not batch-scored
+    # (see _matching_kernels) are narrowed before scoring to states that
+    # share a fingerprint value with the snapshot or whose label tokens
+    # are MinHash-similar to it. This is approximate: a state matching on
+    # labels alone with low token similarity can be skipped.
+    lsh_prefilter: bool = False
+
+    # When True, "visual" fingerprints that are hex strings of at most 16
+    # digits are read as 64-bit SimHash/pHash values and scored as
+    # 1 - hamming_distance / 64. Other values keep exact matching.
+    visual_simhash: bool = False
+
+
+_DEFAULT_CONFIG = MatchingConfig()
+
+
+@lru_cache(maxsize=32)
+def _derived(config: MatchingConfig) -> Tuple[float, float, float]:
+    """
+    Per-config constants used by scoring.
+
+    Returns:
+        (total_weight, semantic_cap, visual_cap), where a cap is the most
+        that component can add to the weighted sum (0.0 for a negative
+        weight).
+    """
+    w_sem = config.semantic_weight
+    w_vis = config.visual_weight
+    return (
+        config.structural_weight + w_sem + w_vis,
+        w_sem if w_sem > 0.0 else 0.0,
+        w_vis if w_vis > 0.0 else 0.0,
+    )
+
 
 # --------------------------------------------------------------------------- #
 # Fingerprint similarity
@@ -58,8 +111,9 @@ class MatchingConfig:
 
 
 def _fingerprint_similarity(
-    snapshot_fps: Dict[str, str],
-    state_fps: Dict[str, str],
+    snapshot_fps: Mapping[str, str],
+    state_fps: Mapping[str, str],
+    overlapping_keys: AbstractSet[str],
 ) -> Tuple[float, Dict[str, float]]:
     """
     Compute a simple similarity score between two fingerprint dictionaries.
@@ -69,21 +123,21 @@ def _fingerprint_similarity(
       are exactly equal, 0.0 otherwise.
     - The final score is the mean over all overlapping keys.
 
+    `overlapping_keys` is the intersection of both key sets, computed by
+    the caller from cached key sets.
+
     Returns:
         (score, per_key_scores)
     """
-    overlapping_keys = set(snapshot_fps.keys()) & set(state_fps.keys())
     if not overlapping_keys:
         return 0.0, {}
 
-    per_key_scores: Dict[str, float] = {}
-    total = 0.0
-    for key in overlapping_keys:
-        s_val = snapshot_fps.get(key)
-        t_val = state_fps.get(key)
-        score = 1.0 if s_val == t_val else 0.0
-        per_key_scores[key] = score
-        total += score
+    # Every key is present on both sides, so index directly. Each score is
+    # float(bool) and the total is a plain sum, with no per-key branch.
+    per_key_scores: Dict[str, float] = {
+        key: float(snapshot_fps[key] == state_fps[key]) for key in overlapping_keys
+    }
+    total = sum(per_key_scores.values())
 
     return total / float(len(overlapping_keys)), per_key_scores
 
@@ -93,81 +147,192 @@ def _fingerprint_similarity(
 # --------------------------------------------------------------------------- #
 
 
-def _collect_labels_from_elements(elements: Iterable[UIElementHint]) -> List[str]:
-    labels: List[str] = []
-    for el in elements:
-        label = getattr(el, "label", None)
-        if label:
-            labels.append(label)
-    return labels
+def _token_set(labels: Iterable[Optional[str]]) -> FrozenSet[str]:
+    """
+    Lowercased whitespace tokens of all non-empty labels, in one pass.
+
+    Tokens are interned (see `_intern_fps`).
+    """
+    return frozenset(
+        sys.intern(token)
+        for label in labels
+        if label
+        for token in label.lower().split()
+    )
 
 
-def _collect_labels_from_snapshot(snapshot: LocalUISnapshot) -> List[str]:
-    labels: List[str] = []
-    for el in snapshot.elements:
-        if el.label:
-            labels.append(el.label)
-    return labels
+# --------------------------------------------------------------------------- #
+# Precomputed match features
+# --------------------------------------------------------------------------- #
 
 
-def _tokenize_labels(labels: Iterable[str]) -> List[str]:
-    tokens: List[str] = []
-    for label in labels:
-        for part in label.lower().split():
-            part = part.strip()
-            if part:
-                tokens.append(part)
-    return tokens
+def _intern(value: Any) -> Any:
+    # sys.intern only accepts exact str instances.
+    return sys.intern(value) if type(value) is str else value
 
 
-def _jaccard_similarity(a: List[str], b: List[str]) -> float:
+def _intern_fps(fps: Mapping[str, str]) -> Dict[str, str]:
     """
-    Basic Jaccard similarity on sets of tokens.
+    Copy a fingerprint mapping with interned keys and values.
 
-    Returns:
-        A float in [0.0, 1.0].
+    Equal fingerprints from the snapshot and the cached states then share
+    one string object, so comparing them is a pointer check.
     """
-    set_a = set(a)
-    set_b = set(b)
-    if not set_a or not set_b:
-        return 0.0
-    intersection = set_a & set_b
-    union = set_a | set_b
-    return len(intersection) / float(len(union))
+    return {_intern(k): _intern(v) for k, v in fps.items()}
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _parse_visual_bits(value: Any) -> Optional[int]:
+    """Return a "visual" fingerprint as a 64-bit int if it is a short hex string."""
+    if type(value) is not str:
+        return None
+    digits = value[2:] if value[:2] in ("0x", "0X") else value
+    if not 0 < len(digits) <= 16 or not _HEX_DIGITS.issuperset(digits):
+        return None
+    return int(digits, 16)
+
+
+@dataclass(frozen=True, slots=True)
+class _SnapshotFeatures:
+    """Snapshot-side inputs to scoring, derived once per match call."""
+
+    fps: Mapping[str, str]
+    keys: FrozenSet[str]
+    tokens: FrozenSet[str]
+    visual_bits: Optional[int]
 
+    @classmethod
+    def from_snapshot(cls, snapshot: LocalUISnapshot) -> "_SnapshotFeatures":
+        fps = _intern_fps(snapshot.fingerprints or {})
+        return cls(
+            fps=fps,
+            keys=frozenset(fps),
+            tokens=_token_set(el.label for el in snapshot.elements),
+            visual_bits=_parse_visual_bits(fps.get("visual")),
+        )
 
-def _semantic_similarity(snapshot: LocalUISnapshot, state: StateView) -> float:
+
+@dataclass(frozen=True, slots=True)
+class _StateFeatures:
+    """
+    Candidate-side inputs to scoring, derived per match call (or once per
+    PreparedCandidates). `fps` is an interned copy used for scoring.
+    """
+
+    fps: Mapping[str, str]
+    keys: FrozenSet[str]
+    tokens: FrozenSet[str]
+    visual_bits: Optional[int]
+
+    @classmethod
+    def from_state(cls, state: StateView) -> "_StateFeatures":
+        fps = _intern_fps(state.fingerprints or {})
+        return cls(
+            fps=fps,
+            keys=frozenset(fps),
+            tokens=_token_set(
+                getattr(el, "label", None) for el in state.interactive_elements
+            ),
+            visual_bits=_parse_visual_bits(fps.get("visual")),
+        )
+
+
+@dataclass
+class PreparedCandidates:
     """
-    Compute a crude semantic similarity based on element labels.
+    A candidate list with its match features computed up front.
+
+    Build one with `prepare_candidates()` when the same states are matched
+    against many snapshots (e.g. once per context). `match_states` and
+    `best_match` accept it in place of a plain iterable of states. When
+    NumPy is installed and the list is large, the candidates are also
+    integer-coded so that all of them are scored in one vectorized pass.
+
+    Otherwise, with `MatchingConfig.lsh_prefilter`, large lists are
+    narrowed with a fingerprint index and a MinHash index over label
+    tokens, both built on first use.
 
-    This is a simple heuristic:
-    - Collect labels from snapshot elements and state.interactive_elements.
-    - Tokenize by whitespace.
-    - Compute Jaccard similarity over token sets.
+    The features are a snapshot of the states at preparation time;
+    prepare again after mutating any of them in place.
     """
-    snapshot_labels = _collect_labels_from_snapshot(snapshot)
-    state_labels = _collect_labels_from_elements(state.interactive_elements)
 
-    tokens_snapshot = _tokenize_labels(snapshot_labels)
-    tokens_state = _tokenize_labels(state_labels)
+    states: Tuple[StateView, ...]
+    features: Tuple[_StateFeatures, ...] = field(repr=False)
+    _encoded: Optional[_matching_kernels.EncodedCandidates] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (key, value) -> positions of states with that fingerprint.
+    _fp_index: Optional[Dict[Tuple[str, Any], List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lsh: Optional[MinHashIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    return _jaccard_similarity(tokens_snapshot, tokens_state)
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def is_for(self, states: Sequence[StateView]) -> bool:
+        """Return True if this was prepared from exactly these state objects."""
+        return len(states) == len(self.states) and all(
+            a is b for a, b in zip(states, self.states)
+        )
+
+    def shortlist(self, snap: "_SnapshotFeatures") -> List[int]:
+        """
+        Positions of states worth scoring for `snap`, in candidate order.
+
+        A state is kept if it shares any fingerprint (key, value) pair with
+        the snapshot or shares a MinHash band with the snapshot's tokens.
+        """
+        if self._fp_index is None:
+            fp_index: Dict[Tuple[str, Any], List[int]] = {}
+            for pos, feats in enumerate(self.features):
+                for item in feats.fps.items():
+                    fp_index.setdefault(item, []).append(pos)
+            self._fp_index = fp_index
+            self._lsh = MinHashIndex([f.tokens for f in self.features])
+
+        found = self._lsh.query(snap.tokens)
+        for item in snap.fps.items():
+            found.update(self._fp_index.get(item, ()))
+        return sorted(found)
+
+
+# Below this many candidates a full scan is cheap enough that the
+# approximate LSH prefilter is not used even when enabled.
+_LSH_MIN_SIZE = 256
+
+
+def prepare_candidates(candidates: Iterable[StateView]) -> PreparedCandidates:
+    """Precompute match features (and, if possible, batch encodings) for candidates."""
+    states = tuple(candidates)
+    features = tuple(_StateFeatures.from_state(state) for state in states)
+    encoded = _matching_kernels.encode(
+        [f.fps for f in features],
+        [f.tokens for f in features],
+        [f.visual_bits for f in features],
+    )
+    prepared = PreparedCandidates(states=states, features=features)
+    prepared._encoded = encoded
+    return prepared
 
 
 # --------------------------------------------------------------------------- #
-# Visual similarity (placeholder)
+# Visual similarity
 # --------------------------------------------------------------------------- #
 
 
 def _visual_similarity(snapshot_fps: Dict[str, str], state_fps: Dict[str, str]) -> float:
     """
-    Placeholder visual similarity.
+    Exact-match visual similarity.
 
     If both snapshot and state expose a "visual" fingerprint and the
     values are exactly equal, returns 1.0; otherwise 0.0.
 
-    A more sophisticated implementation could compute distance between
-    perceptual hashes rather than direct equality.
+    See `_simhash_similarity` for perceptual-hash scoring.
     """
     snap_val = snapshot_fps.get("visual")
     state_val = state_fps.get("visual")
@@ -176,6 +341,11 @@ def _visual_similarity(snapshot_fps: Dict[str, str], state_fps: Dict[str, str])
     return 1.0 if snap_val == state_val else 0.0
 
 
+def _simhash_similarity(a: int, b: int) -> float:
+    """Similarity of two 64-bit SimHash values: 1 - hamming distance / 64."""
+    return 1.0 - (a ^ b).bit_count() / 64.0
+
+
 # --------------------------------------------------------------------------- #
 # Public API
 # --------------------------------------------------------------------------- #
@@ -195,39 +365,75 @@ def score_state_match(
         fingerprints and require_fingerprint_overlap is True).
     """
     if config is None:
-        config = MatchingConfig()
+        config = _DEFAULT_CONFIG
 
-    snap_fps = snapshot.fingerprints or {}
-    state_fps = state.fingerprints or {}
+    return _score_features(
+        _SnapshotFeatures.from_snapshot(snapshot),
+        state,
+        _StateFeatures.from_state(state),
+        config,
+    )
+
+
+def _score_features(
+    snap: _SnapshotFeatures,
+    state: StateView,
+    feats: _StateFeatures,
+    config: MatchingConfig,
+) -> Optional[StateMatchResult]:
+    """Score one candidate from precomputed snapshot and state features."""
+    snap_fps = snap.fps
+    state_fps = feats.fps
 
     # Structural similarity (based on overlapping fingerprints).
-    structural_score, per_key_scores = _fingerprint_similarity(snap_fps, state_fps)
+    structural_score, per_key_scores = _fingerprint_similarity(
+        snap_fps, state_fps, snap.keys & feats.keys
+    )
 
     # Optionally discard candidate if there is no overlap at all.
     if config.require_fingerprint_overlap and not per_key_scores:
         return None
 
-    # Semantic similarity based on element labels.
-    semantic_score = _semantic_similarity(snapshot, state)
-
-    # Visual similarity from "visual" fingerprint.
-    visual_score = _visual_similarity(snap_fps, state_fps)
-
     # Weighted combination.
-    total_weight = (
-        config.structural_weight + config.semantic_weight + config.visual_weight
-    )
+    total_weight, sem_cap, vis_cap = _derived(config)
     if total_weight <= 0.0:
         # Degenerate configuration; treat as no match.
         return None
 
-    combined_score = (
-        structural_score * config.structural_weight
-        + semantic_score * config.semantic_weight
-        + visual_score * config.visual_weight
-    ) / total_weight
+    # Cheap bound first: each remaining component scores at most 1.0 (and
+    # contributes nothing if its weight is negative). Candidates that
+    # cannot reach min_score skip the remaining components.
+    min_score = config.min_score
+    partial = structural_score * config.structural_weight
+    if (partial + sem_cap + vis_cap) / total_weight < min_score:
+        return None
 
-    if combined_score < config.min_score:
+    # Semantic similarity: Jaccard over the label token sets (inlined, as
+    # this runs once per candidate).
+    snap_tokens = snap.tokens
+    state_tokens = feats.tokens
+    if snap_tokens and state_tokens:
+        inter = len(snap_tokens & state_tokens)
+        semantic_score = inter / float(len(snap_tokens) + len(state_tokens) - inter)
+    else:
+        semantic_score = 0.0
+    partial = partial + semantic_score * config.semantic_weight
+    if (partial + vis_cap) / total_weight < min_score:
+        return None
+
+    # Visual similarity from "visual" fingerprint.
+    if (
+        config.visual_simhash
+        and snap.visual_bits is not None
+        and feats.visual_bits is not None
+    ):
+        visual_score = _simhash_similarity(snap.visual_bits, feats.visual_bits)
+    else:
+        visual_score = _visual_similarity(snap_fps, state_fps)
+
+    combined_score = (partial + visual_score * config.visual_weight) / total_weight
+
+    if combined_score < min_score:
         return None
 
     details = StateMatchDetails(
@@ -243,34 +449,130 @@ def score_state_match(
 
 def match_states(
     snapshot: LocalUISnapshot,
-    candidates: Iterable[StateView],
+    candidates: Union[Iterable[StateView], PreparedCandidates],
     config: Optional[MatchingConfig] = None,
+    top_k: Optional[int] = None,
 ) -> List[StateMatchResult]:
     """
     Match a snapshot against multiple candidate states.
 
+    `candidates` may be a PreparedCandidates, which skips per-call
+    feature lookups and enables batch scoring for large lists.
+
+    If `top_k` is given, only the `top_k` best results are returned; they
+    are selected while scoring instead of sorting every result.
+
     Returns:
-        A list of StateMatchResult objects sorted by descending score.
-        Candidates that do not meet `config.min_score` or are filtered
-        out by `require_fingerprint_overlap` are omitted.
+        A list of StateMatchResult objects sorted by descending score
+        (ties keep candidate order). Candidates that do not meet
+        `config.min_score` or are filtered out by
+        `require_fingerprint_overlap` are omitted.
     """
     if config is None:
-        config = MatchingConfig()
-
-    results: List[StateMatchResult] = []
-    for state in candidates:
-        match = score_state_match(snapshot, state, config=config)
-        if match is not None:
-            results.append(match)
+        config = _DEFAULT_CONFIG
+
+    if top_k is not None and top_k <= 0:
+        return []
+
+    # Snapshot-side features are derived once for all candidates; the
+    # candidate side comes from the per-state cache.
+    snap = _SnapshotFeatures.from_snapshot(snapshot)
+
+    pairs: Iterable[Tuple[StateView, _StateFeatures]]
+    if isinstance(candidates, PreparedCandidates):
+        ranked = _rank_encoded(snap, candidates, config)
+        if ranked is not None:
+            # Already ordered; only the kept survivors get full details.
+            if top_k is not None:
+                ranked = ranked[:top_k]
+            return [
+                _score_features(snap, candidates.states[i], candidates.features[i], config)
+                for i in ranked
+            ]
+
+        if config.lsh_prefilter and len(candidates) >= _LSH_MIN_SIZE:
+            # Fall back to a full scan if nothing is shortlisted.
+            shortlist = candidates.shortlist(snap)
+            if shortlist:
+                states, features = candidates.states, candidates.features
+                pairs = ((states[i], features[i]) for i in shortlist)
+                return _select_top(snap, pairs, config, top_k)
+
+        pairs = zip(candidates.states, candidates.features)
+        size: Optional[int] = len(candidates)
+    else:
+        pairs = ((state, _StateFeatures.from_state(state)) for state in candidates)
+        size = len(candidates) if isinstance(candidates, Sized) else None
+
+    return _select_top(snap, pairs, config, top_k, size)
+
+
+def _select_top(
+    snap: _SnapshotFeatures,
+    pairs: Iterable[Tuple[StateView, _StateFeatures]],
+    config: MatchingConfig,
+    top_k: Optional[int],
+    size: Optional[int] = None,
+) -> List[StateMatchResult]:
+    """
+    Score (state, features) pairs and keep the best `top_k` (or all).
 
-    # Sort by score descending.
-    results.sort(key=lambda r: r.score, reverse=True)
+    `size` is the number of pairs when known; the full result list is then
+    allocated once instead of grown by appends.
+    """
+    scored = (_score_features(snap, state, feats, config) for state, feats in pairs)
+    matches = (m for m in scored if m is not None)
+
+    # max() and nlargest() keep the first of equal scores, like a stable
+    # descending sort.
+    if top_k == 1:
+        best = max(matches, key=_by_score, default=None)
+        return [best] if best is not None else []
+    if top_k is not None:
+        return heapq.nlargest(top_k, matches, key=_by_score)
+
+    if size is None:
+        results = list(matches)
+    else:
+        results = [None] * size  # type: ignore[list-item]
+        count = 0
+        for match in matches:
+            results[count] = match
+            count += 1
+        del results[count:]
+    results.sort(key=_by_score, reverse=True)
     return results
 
 
+def _by_score(result: StateMatchResult) -> float:
+    return result.score
+
+
+def _rank_encoded(
+    snap: _SnapshotFeatures,
+    prepared: PreparedCandidates,
+    config: MatchingConfig,
+) -> Optional[List[int]]:
+    """Batch-rank prepared candidates, or None if they were not encoded."""
+    if prepared._encoded is None:
+        return None
+    return _matching_kernels.rank(
+        prepared._encoded,
+        snap.fps,
+        snap.tokens,
+        structural_weight=config.structural_weight,
+        semantic_weight=config.semantic_weight,
+        visual_weight=config.visual_weight,
+        min_score=config.min_score,
+        require_fingerprint_overlap=config.require_fingerprint_overlap,
+        visual_simhash=config.visual_simhash,
+        snap_visual_bits=snap.visual_bits,
+    )
+
+
 def best_match(
     snapshot: LocalUISnapshot,
-    candidates: Iterable[StateView],
+    candidates: Union[Iterable[StateView], PreparedCandidates],
     config: Optional[MatchingConfig] = None,
     min_score: Optional[float] = None,
 ) -> Optional[StateMatchResult]:
@@ -279,7 +581,7 @@ def best_match(
 
     Args:
         snapshot: LocalUISnapshot from a GuidanceProbe.
-        candidates: Iterable of StateView candidates.
+        candidates: Iterable of StateView candidates, or PreparedCandidates.
         config: MatchingConfig (optional).
         min_score: Optional override for the minimum accepted score.
                    If provided, it supersedes config.min_score for this call.
@@ -288,23 +590,20 @@ def best_match(
         The best StateMatchResult, or None if no suitable match exists.
     """
     if config is None:
-        config = MatchingConfig()
+        config = _DEFAULT_CONFIG
 
-    effective_min = config.min_score if min_score is None else float(min_score)
-    local_config = MatchingConfig(
-        structural_weight=config.structural_weight,
-        semantic_weight=config.semantic_weight,
-        visual_weight=config.visual_weight,
-        min_score=effective_min,
-        require_fingerprint_overlap=config.require_fingerprint_overlap,
-    )
+    local_config = config
+    if min_score is not None and float(min_score) != config.min_score:
+        local_config = replace(config, min_score=float(min_score))
 
-    matches = match_states(snapshot, candidates, config=local_config)
+    matches = match_states(snapshot, candidates, config=local_config, top_k=1)
     return matches[0] if matches else None
 
 
 __all__ = [
     "MatchingConfig",
+    "PreparedCandidates",
+    "prepare_candidates",
     "score_state_match",
     "match_states",
     "best_match",
@@ -10,10 +10,31 @@ types (StateView, TransitionView, UIElementHint, PathView).
 
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import repeat
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
+from consumers.guidance._metadata import empty_metadata
 from consumers.sdk.types import (
     StateView,
     TransitionView,
@@ -41,7 +62,13 @@ class GoalType(str, Enum):
     WORKFLOW = "workflow"
 
 
-@dataclass
+# Member -> interned wire value, used by GuidanceGoal.to_dict.
+_GOAL_TYPE_VALUES: Dict[GoalType, str] = {
+    m: sys.intern(m.value) for m in GoalType
+}
+
+
+@dataclass(slots=True)
 class GuidanceGoal:
     """
     High-level description of what the user is trying to achieve.
@@ -63,9 +90,18 @@ class GuidanceGoal:
 
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
+    # Last to_dict(copy=False) result, with the field values it was built
+    # from; goals rarely change after creation, so session refreshes can
+    # reuse it.
+    _shared_dict: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        if not copy:
+            return self._shared_to_dict()
         return {
-            "goal_type": self.goal_type.value,
+            "goal_type": _GOAL_TYPE_VALUES[self.goal_type],
             "intent_id": self.intent_id,
             "target_state_id": self.target_state_id,
             "workflow_id": self.workflow_id,
@@ -74,13 +110,37 @@ class GuidanceGoal:
             "metadata": dict(self.metadata),
         }
 
+    def _shared_to_dict(self) -> Dict[str, Any]:
+        # The cached dict is reused while the scalar fields are unchanged
+        # and `metadata` is still the same object; it holds that object,
+        # so in-place edits to metadata are reflected too.
+        key = (
+            self.goal_type,
+            self.intent_id,
+            self.target_state_id,
+            self.workflow_id,
+            self.label,
+            self.description,
+        )
+        cached = self._shared_dict
+        if (
+            cached is not None
+            and cached[0] == key
+            and cached[1]["metadata"] is self.metadata
+        ):
+            return cached[1]
+        data = self.to_dict()
+        data["metadata"] = self.metadata
+        self._shared_dict = (key, data)
+        return data
+
 
 # --------------------------------------------------------------------------- #
 # Matching / state resolution
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(slots=True)
 class StateMatchDetails:
     """
     Optional diagnostic information for how a state match was computed.
@@ -105,7 +165,7 @@ class StateMatchDetails:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StateMatchResult:
     """
     Result of matching a local UI snapshot to a known StateView.
@@ -151,7 +211,13 @@ class GuidanceStepKind(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Member -> interned wire value, used by GuidanceStep.to_dict.
+_STEP_KIND_VALUES: Dict[GuidanceStepKind, str] = {
+    m: sys.intern(m.value) for m in GuidanceStepKind
+}
+
+
+@dataclass(slots=True)
 class GuidanceStep:
     """
     A single step in a guidance plan.
@@ -186,26 +252,124 @@ class GuidanceStep:
     # while this step is active (for guardrail-like behavior).
     blocking: bool = False
 
-    # Free-form metadata for clients.
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Free-form metadata for clients. Defaults to a shared, read-only
+    # empty dict; assign a new dict to add entries.
+    metadata: Dict[str, Any] = field(default_factory=empty_metadata)
+
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        return _step_fields_to_dict(_STEP_FIELDS(self), copy)
+
+
+# Fetches every serialized GuidanceStep field in one C-level call; paired
+# with `_step_fields_to_dict` so whole step lists can be serialized with
+# `map` instead of a `to_dict()` method call per step.
+_STEP_FIELDS = attrgetter(
+    "step_index",
+    "step_count",
+    "kind",
+    "instruction",
+    "context_id",
+    "source_state_id",
+    "target_state_id",
+    "transition",
+    "element_hint",
+    "notes",
+    "blocking",
+    "metadata",
+)
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "step_index": int(self.step_index),
-            "step_count": int(self.step_count),
-            "kind": self.kind.value,
-            "instruction": self.instruction,
-            "context_id": self.context_id,
-            "source_state_id": self.source_state_id,
-            "target_state_id": self.target_state_id,
-            "transition": self.transition.to_dict() if self.transition else None,
-            "element_hint": self.element_hint.to_dict()
-            if self.element_hint
-            else None,
-            "notes": self.notes,
-            "blocking": bool(self.blocking),
-            "metadata": dict(self.metadata),
-        }
+
+def _step_fields_to_dict(fields: tuple, copy: bool = True) -> Dict[str, Any]:
+    (
+        step_index,
+        step_count,
+        kind,
+        instruction,
+        context_id,
+        source_state_id,
+        target_state_id,
+        transition,
+        element_hint,
+        notes,
+        blocking,
+        metadata,
+    ) = fields
+    return {
+        "step_index": int(step_index),
+        "step_count": int(step_count),
+        "kind": _STEP_KIND_VALUES[kind],
+        "instruction": instruction,
+        "context_id": context_id,
+        "source_state_id": source_state_id,
+        "target_state_id": target_state_id,
+        "transition": transition.to_dict() if transition else None,
+        "element_hint": element_hint.to_dict() if element_hint else None,
+        "notes": notes,
+        "blocking": bool(blocking),
+        "metadata": dict(metadata) if copy else metadata,
+    }
+
+
+def _steps_to_dict(
+    steps: Sequence[GuidanceStep], copy: bool = True
+) -> List[Dict[str, Any]]:
+    """Serialize a step sequence, as `s.to_dict(copy=copy)` would per step."""
+    return list(map(_step_fields_to_dict, map(_STEP_FIELDS, steps), repeat(copy)))
+
+
+class LazyStepList(Sequence[GuidanceStep]):
+    """
+    Read-only sequence of GuidanceSteps built on first access.
+
+    Holds a step count and a factory `make(index) -> GuidanceStep`; each
+    step is created when it is first indexed and then memoized. Used for
+    long path plans, where presentation layers usually only look at the
+    current step.
+    """
+
+    __slots__ = ("_make", "_steps")
+
+    def __init__(self, count: int, make: Callable[[int], GuidanceStep]) -> None:
+        self._make = make
+        self._steps: List[Optional[GuidanceStep]] = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    @overload
+    def __getitem__(self, index: int) -> GuidanceStep: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[GuidanceStep]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[GuidanceStep, List[GuidanceStep]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._steps)))]
+        step = self._steps[index]
+        if step is None:
+            if index < 0:
+                index += len(self._steps)
+            step = self._steps[index] = self._make(index)
+        return step
+
+    def __iter__(self) -> Iterator[GuidanceStep]:
+        # Walk the slots directly instead of going through __getitem__;
+        # the list never changes length, only None slots are filled in.
+        steps = self._steps
+        for i, step in enumerate(steps):
+            if step is None:
+                step = steps[i] = self._make(i)
+            yield step
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyStepList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyStepList({list(self)!r})"
 
 
 # --------------------------------------------------------------------------- #
@@ -230,7 +394,13 @@ class GuidancePlanStatus(str, Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+# Member -> interned wire value, used by GuidancePlan.to_dict.
+_PLAN_STATUS_VALUES: Dict[GuidancePlanStatus, str] = {
+    m: sys.intern(m.value) for m in GuidancePlanStatus
+}
+
+
+@dataclass(slots=True)
 class GuidancePlan:
     """
     A full plan from a current state towards a goal.
@@ -248,8 +418,8 @@ class GuidancePlan:
 
     status: GuidancePlanStatus
 
-    # Ordered list of guidance steps.
-    steps: List[GuidanceStep] = field(default_factory=list)
+    # Ordered guidance steps; path plans use a LazyStepList.
+    steps: Sequence[GuidanceStep] = field(default_factory=list)
 
     # Optional underlying path information for debugging.
     path_view: Optional[PathView] = None
@@ -257,18 +427,29 @@ class GuidancePlan:
     # Arbitrary metadata.
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """
+        Serialize the plan to plain data.
+
+        With `copy=False`, metadata dicts are returned as-is instead of
+        being copied. Use it when the result is only read (e.g. passed
+        straight to `json.dumps`) and must not be mutated.
+        """
         return {
             "context_id": self.context_id,
-            "goal": self.goal.to_dict(),
+            "goal": self.goal.to_dict(copy=copy),
             "source_state_id": self.source_state_id,
             "target_state_id": self.target_state_id,
-            "status": self.status.value,
-            "steps": [s.to_dict() for s in self.steps],
+            "status": _PLAN_STATUS_VALUES[self.status],
+            "steps": _steps_to_dict(self.steps, copy),
             "path": self.path_view.to_dict() if self.path_view else None,
-            "metadata": dict(self.metadata),
+            "metadata": dict(self.metadata) if copy else self.metadata,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the plan to compact UTF-8 JSON (same document as `to_dict()`)."""
+        return _json_bytes(self.to_dict(copy=False))
+
 
 class SessionStatus(str, Enum):
     """
@@ -282,7 +463,18 @@ class SessionStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Member -> interned wire value, used by GuidanceSessionState.to_dict.
+_SESSION_STATUS_VALUES: Dict[SessionStatus, str] = {
+    m: sys.intern(m.value) for m in SessionStatus
+}
+
+# Statuses after which a session no longer advances.
+_TERMINAL_STATUSES = frozenset(
+    (SessionStatus.COMPLETED, SessionStatus.FAILED, SessionStatus.CANCELLED)
+)
+
+
+@dataclass(slots=True)
 class GuidanceSessionState:
     """
     Lightweight state container for an ongoing guidance session.
@@ -313,24 +505,35 @@ class GuidanceSessionState:
 
     def is_finished(self) -> bool:
         """Return True if the session is in a terminal status."""
-        return self.status in {
-            SessionStatus.COMPLETED,
-            SessionStatus.FAILED,
-            SessionStatus.CANCELLED,
-        }
+        return self.status in _TERMINAL_STATUSES
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Serialize the session; see `GuidancePlan.to_dict` for `copy`."""
         return {
             "context_id": self.context_id,
-            "plan": self.plan.to_dict(),
+            "plan": self.plan.to_dict(copy=copy),
             "current_step_index": int(self.current_step_index),
             "current_state": self.current_state.to_dict()
             if self.current_state
             else None,
-            "status": self.status.value,
-            "metadata": dict(self.metadata),
+            "status": _SESSION_STATUS_VALUES[self.status],
+            "metadata": dict(self.metadata) if copy else self.metadata,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the session to compact UTF-8 JSON (see `GuidancePlan`)."""
+        return _json_bytes(self.to_dict(copy=False))
+
+
+def _json_bytes(data: Dict[str, Any]) -> bytes:
+    # orjson when installed, otherwise the standard library; the result is
+    # only read, so the uncopied to_dict(copy=False) output is safe here.
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
 
 __all__ = [
     "GoalType",
@@ -339,6 +542,7 @@ __all__ = [
     "StateMatchResult",
     "GuidanceStepKind",
     "GuidanceStep",
+    "LazyStepList",
     "GuidancePlanStatus",
     "GuidancePlan",
     "SessionStatus",
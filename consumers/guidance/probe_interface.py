@@ -1,7 +1,7 @@
 """
 Probe interface for the Guidance Client.
 
-This module defines an abstract interface for *local probes* that
+This module defines the interface (a Protocol) for *local probes* that
 capture information about the user's current UI state.
 
 A probe is platform-specific (web, desktop, mobile, etc.) and runs
@@ -18,9 +18,21 @@ deliberately dependency-free and contains *no* platform-specific code.
 
 from __future__ import annotations
 
+import json
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Tuple
+
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+from common.models import _bbox_kernels
+from common.models._codegen import fast_to_dict
+from consumers.guidance._metadata import empty_metadata
 
 
 class ProbingError(Exception):
@@ -37,7 +49,8 @@ class ProbingError(Exception):
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@fast_to_dict(doc="Serialize the bounding box to a JSON-friendly dict.")
+@dataclass(frozen=True, slots=True)
 class BoundingBoxSnapshot:
     """
     Lightweight bounding box representation for local elements.
@@ -47,6 +60,10 @@ class BoundingBoxSnapshot:
     coordinates). The guidance engine does not assume a specific
     coordinate space; it only forwards these values to presentation
     layers (overlay, etc.).
+
+    Boxes are immutable (like `common.models.BoundingBox`), so one box
+    can be shared by several elements or snapshots; for bulk access use
+    `LocalUISnapshot.bbox_arrays()`.
     """
 
     x: int
@@ -54,16 +71,43 @@ class BoundingBoxSnapshot:
     width: int
     height: int
 
-    def to_dict(self) -> Dict[str, int]:
-        return {
-            "x": int(self.x),
-            "y": int(self.y),
-            "width": int(self.width),
-            "height": int(self.height),
-        }
-
-
-@dataclass
+    def __post_init__(self) -> None:
+        # Coerce once here (floats, NumPy integers, ...) so serialization
+        # can emit the fields as-is. Exact ints, the usual case, are kept.
+        if (
+            type(self.x) is not int
+            or type(self.y) is not int
+            or type(self.width) is not int
+            or type(self.height) is not int
+        ):
+            for name in ("x", "y", "width", "height"):
+                object.__setattr__(self, name, int(getattr(self, name)))
+
+
+# Generated `to_dict` expression for an element's bounding box. Same dict
+# as BoundingBoxSnapshot.to_dict, built inline to save a call per element.
+_BBOX_EXPR = (
+    '{"x": b.x, "y": b.y, "width": b.width, "height": b.height}'
+    " if (b := self.bounding_box) is not None else None"
+)
+
+
+@lru_cache(maxsize=4096)
+def _shared_label(label: str) -> str:
+    # Bounded intern table for labels: returns the first equal string seen
+    # among recent labels. Unlike sys.intern, evicted labels can be freed,
+    # which matters for open-ended UI text.
+    return label
+
+
+@fast_to_dict(
+    exprs={
+        "bounding_box": _BBOX_EXPR,
+        "metadata": "dict(self.metadata)",
+    },
+    doc="Serialize the element to a JSON-friendly dict.",
+)
+@dataclass(slots=True)
 class LocalElementSnapshot:
     """
     Representation of a UI element as seen by a local probe.
@@ -92,25 +136,29 @@ class LocalElementSnapshot:
     enabled: Optional[bool] = None
     visible: Optional[bool] = None
 
-    # Arbitrary implementation-specific metadata.
-    metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "local_id": self.local_id,
-            "role": self.role,
-            "label": self.label,
-            "bounding_box": (
-                self.bounding_box.to_dict() if self.bounding_box else None
-            ),
-            "path": self.path,
-            "enabled": self.enabled,
-            "visible": self.visible,
-            "metadata": dict(self.metadata),
-        }
-
-
-@dataclass
+    # Arbitrary implementation-specific metadata. Defaults to a shared,
+    # read-only empty dict; assign a new dict to add entries.
+    metadata: Dict[str, Any] = field(default_factory=empty_metadata)
+
+    def __post_init__(self) -> None:
+        # Large trees repeat the same roles and labels many times; share
+        # one string object per distinct value. sys.intern and the label
+        # cache only accept exact str instances.
+        if type(self.role) is str:
+            self.role = sys.intern(self.role)
+        if type(self.label) is str:
+            self.label = _shared_label(self.label)
+
+
+@fast_to_dict(
+    exprs={
+        "fingerprints": "dict(self.fingerprints)",
+        "elements": "[el.to_dict() for el in self.elements]",
+        "metadata": "dict(self.metadata)",
+    },
+    doc="Serialize the snapshot to a JSON-friendly dict.",
+)
+@dataclass(slots=True)
 class LocalUISnapshot:
     """
     A snapshot of the current UI as seen by a probe.
@@ -126,8 +174,14 @@ class LocalUISnapshot:
     context_hint: Optional[str] = None
 
     # Fingerprints describing the current UI configuration.
-    # Typical keys: "structural", "semantic", "visual".
-    fingerprints: Dict[str, str] = field(default_factory=dict)
+    # Typical keys: "structural", "semantic", "visual". The key set is
+    # open: the matcher compares every key present on both sides, so
+    # probes may add platform-specific fingerprints (and the matcher
+    # builds its own interned copy once per snapshot, so lookups here are
+    # not on the hot path).
+    # Any read-only mapping is accepted; the engine never mutates it, so
+    # callers may pass an existing state's fingerprints without copying.
+    fingerprints: Mapping[str, str] = field(default_factory=dict)
 
     # Optional list of elements visible in the current UI.
     elements: List[LocalElementSnapshot] = field(default_factory=list)
@@ -135,13 +189,92 @@ class LocalUISnapshot:
     # Arbitrary metadata (probe name, timestamps, window title, etc.).
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "context_hint": self.context_hint,
-            "fingerprints": dict(self.fingerprints),
-            "elements": [el.to_dict() for el in self.elements],
-            "metadata": dict(self.metadata),
-        }
+    # Struct-of-arrays view of element bounding boxes (x, y, width,
+    # height), aligned with `_bbox_elements`. Built on demand and rebuilt
+    # when `elements` is replaced or changes length; call
+    # `invalidate_bbox_arrays()` after editing boxes in place. The list the
+    # arrays were built from is held rather than its id(), which a new list
+    # can reuse once the old one is freed.
+    _bbox_source: Optional[List[LocalElementSnapshot]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bbox_len: int = field(default=-1, init=False, repr=False, compare=False)
+    _bbox_arrays: Optional[Tuple[array, array, array, array]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bbox_elements: List[LocalElementSnapshot] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # --- hit-testing -----------------------------------------------------------
+
+    def bbox_arrays(self) -> Tuple[array, array, array, array]:
+        """
+        Return (xs, ys, widths, heights) as parallel integer arrays.
+
+        Only elements that have a bounding box are included, in the order
+        they appear in `elements`. The arrays are cached; treat them as
+        read-only.
+        """
+        elements = self.elements
+        if (
+            self._bbox_arrays is None
+            or self._bbox_source is not elements
+            or self._bbox_len != len(elements)
+        ):
+            xs, ys, ws, hs = array("l"), array("l"), array("l"), array("l")
+            boxed: List[LocalElementSnapshot] = []
+            for el in elements:
+                bb = el.bounding_box
+                if bb is None:
+                    continue
+                xs.append(bb.x)
+                ys.append(bb.y)
+                ws.append(bb.width)
+                hs.append(bb.height)
+                boxed.append(el)
+            self._bbox_arrays = (xs, ys, ws, hs)
+            self._bbox_elements = boxed
+            self._bbox_source = elements
+            self._bbox_len = len(elements)
+        return self._bbox_arrays
+
+    def find_elements_containing(self, x: int, y: int) -> List[LocalElementSnapshot]:
+        """Return all elements whose bounding box contains the point (x, y)."""
+        xs, ys, ws, hs = self.bbox_arrays()
+        boxed = self._bbox_elements
+        return [boxed[i] for i in _bbox_kernels.contains(xs, ys, ws, hs, x, y)]
+
+    def find_elements_intersecting(
+        self, x: int, y: int, width: int, height: int
+    ) -> List[LocalElementSnapshot]:
+        """Return all elements whose bounding box overlaps the given rectangle."""
+        xs, ys, ws, hs = self.bbox_arrays()
+        boxed = self._bbox_elements
+        return [
+            boxed[i]
+            for i in _bbox_kernels.intersect_any(xs, ys, ws, hs, x, y, width, height)
+        ]
+
+    def invalidate_bbox_arrays(self) -> None:
+        """Drop the cached bounding-box arrays so they are rebuilt on next use."""
+        self._bbox_arrays = None
+
+    # --- serialization ---------------------------------------------------------
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the snapshot to compact UTF-8 JSON.
+
+        Uses orjson when it is installed and falls back to the standard
+        library otherwise. Both produce the same document as `to_dict()`.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
 
 
 # --------------------------------------------------------------------------- #
@@ -149,19 +282,19 @@ class LocalUISnapshot:
 # --------------------------------------------------------------------------- #
 
 
-class GuidanceProbe(ABC):
+class GuidanceProbe(Protocol):
     """
-    Abstract base class for guidance probes.
+    Protocol that guidance probes implement.
 
     A concrete implementation is responsible for connecting to a
     specific platform (browser, OS accessibility API, etc.) and
-    returning LocalUISnapshot instances.
+    returning LocalUISnapshot instances. Any object with a matching
+    `capture_snapshot` method can be used; subclassing is optional.
 
     Probes must be *side-effect free* with respect to the target app:
     they observe, but do not click or type.
     """
 
-    @abstractmethod
     def capture_snapshot(self) -> LocalUISnapshot:
         """
         Capture the current UI snapshot.
@@ -172,7 +305,7 @@ class GuidanceProbe(ABC):
         Raises:
             ProbingError if the snapshot cannot be captured.
         """
-        raise NotImplementedError
+        ...
 
 
 # --------------------------------------------------------------------------- #
@@ -181,7 +314,7 @@ class GuidanceProbe(ABC):
 
 
 @dataclass
-class NullProbe(GuidanceProbe):
+class NullProbe:
     """
     A trivial probe that returns an empty snapshot.
 
@@ -201,11 +334,12 @@ class NullProbe(GuidanceProbe):
     def capture_snapshot(self) -> LocalUISnapshot:
         # Return a shallow copy so callers can modify it without
         # affecting the stored base_snapshot.
+        base = self.base_snapshot
         return LocalUISnapshot(
-            context_hint=self.base_snapshot.context_hint,
-            fingerprints=dict(self.base_snapshot.fingerprints),
-            elements=list(self.base_snapshot.elements),
-            metadata=dict(self.base_snapshot.metadata),
+            context_hint=base.context_hint,
+            fingerprints=dict(base.fingerprints),
+            elements=list(base.elements),
+            metadata=dict(base.metadata),
         )
 
 
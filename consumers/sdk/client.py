@@ -4,8 +4,17 @@ Lightweight Python client SDK for Ariane Atlas.
 This module provides a small, dependency-free wrapper around the Atlas
 HTTP API exposed by `atlas.api.http_server`.
 
-It uses only the Python standard library (urllib + json) and the
-dataclasses in `consumers.sdk.types`.
+It uses only the Python standard library (http.client + json) and the
+dataclasses in `consumers.sdk.types`. If `orjson` is installed it is
+used to encode request bodies and decode responses. Each client keeps a small pool of
+keep-alive connections, so consecutive calls reuse the same TCP (and
+TLS) connection when the server allows it; use the client as a context
+manager or call `close()` to release them. With `etag_cache_size` set,
+GET responses that carry an `ETag` are cached and revalidated with
+`If-None-Match`, so unchanged resources come back as a bodiless 304.
+`get_context`, `get_state` and `get_transition` results can additionally
+be memoized for `lookup_cache_ttl` seconds (off by default); `invalidate()`
+drops them, and `ingest_bundle` does so automatically.
 
 Typical usage:
 
@@ -34,12 +43,22 @@ Typical usage:
 
 from __future__ import annotations
 
+import gzip
+import http.client
 import json
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+import random
+import select
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+try:  # Optional fast JSON codec; the stdlib json module is used otherwise.
+    import orjson
+except ImportError:
+    orjson = None
 
 from .types import (
     APIErrorDetail,
@@ -52,6 +71,17 @@ from .types import (
 
 JSONDict = Dict[str, Any]
 
+# (etag, status, raw body, headers) of a cached GET response.
+_CachedResponse = Tuple[str, int, bytes, Dict[str, str]]
+
+# Gateway/availability errors that are usually transient.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+# State ids per bulk transitions request, keeping URLs well under common
+# server and proxy limits.
+_BULK_CHUNK_SIZE = 256
+
 
 # --------------------------------------------------------------------------- #
 # Config and errors
@@ -75,12 +105,60 @@ class AtlasClientConfig:
             "X-API-Key" (see atlas.api.auth.AuthConfig).
         timeout:
             Socket timeout (seconds) for HTTP requests.
+        connect_timeout:
+            Timeout (seconds) for opening a new connection, capped at
+            `timeout`. Kept short so an unreachable server fails (and is
+            retried) quickly; once connected, `timeout` applies to reads.
+        gzip_uploads:
+            If True, bundle uploads (ingest_bundle) of at least
+            `gzip_min_bytes` are sent gzip-compressed with
+            "Content-Encoding: gzip". The bundled Atlas HTTP server
+            accepts this; disable it for servers that do not.
+        gzip_min_bytes:
+            Smallest encoded body (in bytes) worth compressing.
+        max_retries:
+            How many times a request is retried after a transient failure
+            (connection error, or HTTP 502/503/504 for idempotent methods).
+            0 disables retries.
+        retry_backoff:
+            Base delay (seconds) for exponential backoff between retries;
+            each wait is drawn uniformly from [0, retry_backoff * 2**attempt].
+        pool_size:
+            Maximum number of idle keep-alive connections the client keeps
+            for reuse. 0 disables connection reuse.
+        etag_cache_size:
+            Maximum number of GET responses kept for conditional requests
+            (least recently used are evicted first). Only responses with an
+            `ETag` header are cached; any non-GET request clears the cache.
+            A 304 answer saves the transfer, and the cached body is decoded
+            again so results never share objects. 0 (the default) disables
+            the cache.
+        lookup_cache_size:
+            Maximum number of `get_context` / `get_state` / `get_transition`
+            results memoized by the client (least recently used are evicted
+            first). 0 disables memoization.
+        lookup_cache_ttl:
+            Seconds a memoized lookup is served without asking the server.
+            This bounds how stale results can be when other clients write
+            to Atlas; `ingest_bundle` on this client invalidates them
+            immediately. Every caller receives the same view object, so
+            treat memoized views as read-only. 0 (the default) disables
+            memoization.
     """
 
     base_url: str
     api_key: Optional[str] = None
     api_key_header: str = "X-API-Key"
     timeout: int = 10
+    connect_timeout: float = 2.0
+    gzip_uploads: bool = True
+    gzip_min_bytes: int = 1024
+    max_retries: int = 2
+    retry_backoff: float = 0.2
+    pool_size: int = 4
+    etag_cache_size: int = 0
+    lookup_cache_size: int = 1024
+    lookup_cache_ttl: float = 0.0
 
 
 class AtlasClientError(Exception):
@@ -145,17 +223,76 @@ class AtlasClient:
             get_transition()
             list_outgoing()
             list_incoming()
+            list_outgoing_bulk()
+            list_incoming_bulk()
 
       - Paths:
             shortest_path()
 
       - Ingest (write):
             ingest_bundle()
+
+    The client is thread-safe; each request borrows its own connection
+    from the pool.
     """
 
     def __init__(self, config: AtlasClientConfig) -> None:
         self._cfg = config
 
+        parts = urlsplit(config.base_url)
+        self._host = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self._conn_cls = (
+            _HTTPSConnection if parts.scheme == "https" else _HTTPConnection
+        )
+        # Idle keep-alive connections, most recently used last.
+        self._idle: List[http.client.HTTPConnection] = []
+        self._idle_lock = threading.Lock()
+        # Request target -> last cacheable GET response, least recently
+        # used first.
+        self._etag_cache: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # (kind, context_id, id) -> (expiry, view) for the get_* lookups,
+        # least recently used first. The generation is bumped by
+        # invalidate() so fetches that raced with it are not stored.
+        self._lookups: "OrderedDict[Tuple[str, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lookup_lock = threading.Lock()
+        self._lookup_generation = 0
+
+    def close(self) -> None:
+        """Close idle pooled connections. The client remains usable."""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        with self._etag_lock:
+            self._etag_cache.clear()
+
+    def invalidate(self, context_id: Optional[str] = None) -> None:
+        """
+        Forget memoized get_context / get_state / get_transition results.
+
+        Args:
+            context_id:
+                Only drop results for this context. If None, drop all.
+        """
+        with self._lookup_lock:
+            self._lookup_generation += 1
+            if context_id is None:
+                self._lookups.clear()
+                return
+            for key in [k for k in self._lookups if k[1] == context_id]:
+                del self._lookups[key]
+
+    def __enter__(self) -> "AtlasClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # ------------------------------------------------------------------ #
     # Health
     # ------------------------------------------------------------------ #
@@ -200,9 +337,16 @@ class AtlasClient:
         """
         Retrieve a single context by id.
 
+        Results can be memoized; see `AtlasClientConfig.lookup_cache_ttl`.
+
         Raises:
             AtlasClientError if not found or on other error.
         """
+        return self._memoized(
+            ("context", context_id), lambda: self._fetch_context(context_id)
+        )
+
+    def _fetch_context(self, context_id: str) -> ContextInfo:
         path = f"/contexts/{context_id}"
         _, payload, _ = self._request("GET", path)
         ctx_dict = payload.get("context")
@@ -232,9 +376,17 @@ class AtlasClient:
         """
         Retrieve a single state within a context.
 
+        Results can be memoized; see `AtlasClientConfig.lookup_cache_ttl`.
+
         Raises:
             AtlasClientError if not found or on other error.
         """
+        return self._memoized(
+            ("state", context_id, state_id),
+            lambda: self._fetch_state(context_id, state_id),
+        )
+
+    def _fetch_state(self, context_id: str, state_id: str) -> StateView:
         path = f"/contexts/{context_id}/states/{state_id}"
         _, payload, _ = self._request("GET", path)
         rec = payload.get("state")
@@ -269,9 +421,19 @@ class AtlasClient:
         """
         Retrieve a single transition by id within a context.
 
+        Results can be memoized; see `AtlasClientConfig.lookup_cache_ttl`.
+
         Raises:
             AtlasClientError if not found or on other error.
         """
+        return self._memoized(
+            ("transition", context_id, transition_id),
+            lambda: self._fetch_transition(context_id, transition_id),
+        )
+
+    def _fetch_transition(
+        self, context_id: str, transition_id: str
+    ) -> TransitionView:
         path = f"/contexts/{context_id}/transitions/{transition_id}"
         _, payload, _ = self._request("GET", path)
         rec = payload.get("transition")
@@ -309,6 +471,60 @@ class AtlasClient:
         items = payload.get("incoming") or []
         return [TransitionView.from_transition_record(rec) for rec in items]
 
+    def list_outgoing_bulk(
+        self, context_id: str, state_ids: Iterable[str]
+    ) -> Dict[str, List[TransitionView]]:
+        """
+        List outgoing transitions for many states in as few requests as
+        possible (GET /contexts/{ctx}/transitions?source_in=...).
+
+        Returns:
+            Dict mapping every requested state id to its outgoing
+            transitions. Unknown states map to an empty list rather than
+            raising as `list_outgoing` does. State ids must not contain
+            commas.
+        """
+        return self._list_transitions_bulk(
+            context_id, state_ids, "source_in", "source_state_id"
+        )
+
+    def list_incoming_bulk(
+        self, context_id: str, state_ids: Iterable[str]
+    ) -> Dict[str, List[TransitionView]]:
+        """
+        List incoming transitions for many states in as few requests as
+        possible (GET /contexts/{ctx}/transitions?target_in=...).
+
+        Returns:
+            Dict mapping every requested state id to its incoming
+            transitions; see `list_outgoing_bulk`.
+        """
+        return self._list_transitions_bulk(
+            context_id, state_ids, "target_in", "target_state_id"
+        )
+
+    def _list_transitions_bulk(
+        self,
+        context_id: str,
+        state_ids: Iterable[str],
+        param: str,
+        endpoint_field: str,
+    ) -> Dict[str, List[TransitionView]]:
+        ids = list(dict.fromkeys(state_ids))
+        result: Dict[str, List[TransitionView]] = {state_id: [] for state_id in ids}
+        path = f"/contexts/{context_id}/transitions"
+        for start in range(0, len(ids), _BULK_CHUNK_SIZE):
+            chunk = ids[start : start + _BULK_CHUNK_SIZE]
+            _, payload, _ = self._request("GET", path, query={param: ",".join(chunk)})
+            for rec in payload.get("transitions") or []:
+                view = TransitionView.from_transition_record(rec)
+                # Filtering here as well keeps the result correct against
+                # servers that ignore the parameter and return everything.
+                bucket = result.get(getattr(view, endpoint_field))
+                if bucket is not None:
+                    bucket.append(view)
+        return result
+
     # ------------------------------------------------------------------ #
     # Path / navigation
     # ------------------------------------------------------------------ #
@@ -367,13 +583,51 @@ class AtlasClient:
                   "transitions": { "count": ... }
                 }
         """
-        _, payload, _ = self._request("POST", "/ingest/bundle", body=bundle)
+        try:
+            _, payload, _ = self._request(
+                "POST",
+                "/ingest/bundle",
+                body=bundle,
+                compress=self._cfg.gzip_uploads,
+            )
+        finally:
+            # A bundle may span several contexts (and may have been partly
+            # applied if the request failed), so drop every memoized lookup.
+            self.invalidate()
         return payload or {}
 
     # ------------------------------------------------------------------ #
     # Low-level HTTP helpers
     # ------------------------------------------------------------------ #
 
+    def _memoized(self, key: Tuple[str, ...], fetch: Callable[[], Any]) -> Any:
+        """
+        Return the memoized result for `key`, calling `fetch` on a miss
+        or after the entry's TTL expired. Errors are not cached.
+        """
+        ttl = self._cfg.lookup_cache_ttl
+        if ttl <= 0 or self._cfg.lookup_cache_size <= 0:
+            return fetch()
+
+        with self._lookup_lock:
+            entry = self._lookups.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._lookups.move_to_end(key)
+                    return entry[1]
+                del self._lookups[key]
+            generation = self._lookup_generation
+
+        value = fetch()
+
+        with self._lookup_lock:
+            if generation == self._lookup_generation:
+                self._lookups[key] = (time.monotonic() + ttl, value)
+                self._lookups.move_to_end(key)
+                while len(self._lookups) > self._cfg.lookup_cache_size:
+                    self._lookups.popitem(last=False)
+        return value
+
     def _request(
         self,
         method: str,
@@ -381,6 +635,7 @@ class AtlasClient:
         *,
         query: Optional[Dict[str, Any]] = None,
         body: Optional[JSONDict | List[Any]] = None,
+        compress: bool = False,
     ) -> Tuple[int, JSONDict, Dict[str, str]]:
         """
         Perform a low-level HTTP request.
@@ -394,6 +649,9 @@ class AtlasClient:
                 Optional query parameters as a dict.
             body:
                 Optional JSON-serializable object for request body.
+            compress:
+                If True, gzip the encoded body when it is at least
+                `config.gzip_min_bytes` long.
 
         Returns:
             (status, payload_dict, headers_dict)
@@ -405,10 +663,12 @@ class AtlasClient:
             path = "/" + path
 
         url = self._cfg.base_url.rstrip("/") + path
+        target = self._base_path + path
 
         if query:
             qs = urlencode(query, doseq=True)
             url = url + "?" + qs
+            target = target + "?" + qs
 
         headers: Dict[str, str] = {
             "Accept": "application/json",
@@ -419,42 +679,47 @@ class AtlasClient:
 
         data_bytes: Optional[bytes] = None
         if body is not None:
-            data_bytes = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            data_bytes = _encode_json(body)
             headers["Content-Type"] = "application/json; charset=utf-8"
-
-        req = Request(
-            url=url,
-            data=data_bytes,
-            headers=headers,
-            method=method.upper(),
-        )
+            if compress and len(data_bytes) >= self._cfg.gzip_min_bytes:
+                # Level 3 gets most of the size reduction on JSON at a
+                # fraction of the CPU cost of the default level 9.
+                data_bytes = gzip.compress(data_bytes, compresslevel=3)
+                headers["Content-Encoding"] = "gzip"
+
+        method = method.upper()
+        cacheable = method == "GET" and self._cfg.etag_cache_size > 0
+        cached = None
+        if cacheable:
+            with self._etag_lock:
+                cached = self._etag_cache.get(target)
+                if cached is not None:
+                    self._etag_cache.move_to_end(target)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
 
         try:
-            with urlopen(req, timeout=self._cfg.timeout) as resp:
-                status = resp.getcode()
-                resp_headers = {k.lower(): v for k, v in resp.headers.items()}
-                raw = resp.read()
-        except HTTPError as exc:
-            # Even for HTTPError, we may get a body with error details
-            status = exc.code
-            resp_headers = {k.lower(): v for k, v in exc.headers.items()}
-            raw = exc.read()
-            self._raise_from_error(status, raw, resp_headers)
-            # If _raise_from_error does not raise, treat as generic
-            raise AtlasClientError(
-                f"HTTP error {status} for {url}",
-                status=status,
-                raw_body=raw.decode("utf-8", errors="replace") if raw else None,
-            )
-        except URLError as exc:
+            status, resp_headers, raw = self._send(method, target, data_bytes, headers)
+        except (OSError, http.client.HTTPException) as exc:
             raise AtlasClientError(f"Connection error for {url}: {exc}") from exc
+        finally:
+            if method != "GET":
+                # Writes may change any resource; don't serve stale reads.
+                self.clear_cache()
+
+        if status == 304 and cached is not None:
+            _, status, raw, cached_headers = cached
+            resp_headers = dict(cached_headers)
+
+        if status >= 400:
+            # Even for error statuses, we may get a body with error details
+            self._raise_from_error(status, raw, resp_headers)
 
         payload: JSONDict = {}
         if raw:
-            text = raw.decode("utf-8", errors="replace")
             if self._is_json_response(resp_headers):
                 try:
-                    decoded = json.loads(text)
+                    decoded = _decode_json(raw)
                     if isinstance(decoded, dict):
                         payload = decoded
                     else:
@@ -464,16 +729,91 @@ class AtlasClient:
                     raise AtlasClientError(
                         f"Invalid JSON response from {url}",
                         status=status,
-                        raw_body=text,
+                        raw_body=raw.decode("utf-8", errors="replace"),
                     )
             else:
-                payload = {"_raw": text}
+                payload = {"_raw": raw.decode("utf-8", errors="replace")}
 
-        if status >= 400:
-            self._raise_from_error(status, raw, resp_headers)
+        etag = resp_headers.get("etag")
+        if cacheable and status == 200 and etag:
+            with self._etag_lock:
+                self._etag_cache[target] = (etag, status, raw, resp_headers)
+                self._etag_cache.move_to_end(target)
+                while len(self._etag_cache) > self._cfg.etag_cache_size:
+                    self._etag_cache.popitem(last=False)
 
         return status, payload, resp_headers
 
+    def _send(
+        self,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send a request over a pooled connection, with retries and
+        jittered exponential backoff.
+
+        Idempotent requests are retried on connection errors and on
+        HTTP 502/503/504. Other methods (e.g. POST) are only retried when
+        the connection was refused, since the server never saw them.
+        The last error is re-raised once `max_retries` is exhausted.
+
+        Returns:
+            (status, lower-cased headers, raw body)
+        """
+        idempotent = method in _IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            conn = self._acquire()
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                refused = isinstance(exc, ConnectionRefusedError)
+                if attempt >= self._cfg.max_retries or not (idempotent or refused):
+                    raise
+            else:
+                status = resp.status
+                resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+                if resp.will_close:
+                    conn.close()
+                else:
+                    self._release(conn)
+                if (
+                    attempt >= self._cfg.max_retries
+                    or not idempotent
+                    or status not in _RETRY_STATUSES
+                ):
+                    return status, resp_headers, raw
+            time.sleep(random.uniform(0.0, self._cfg.retry_backoff * (2 ** attempt)))
+            attempt += 1
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        """Take an idle pooled connection, or open a new one."""
+        with self._idle_lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if not _connection_dropped(conn):
+                    return conn
+                conn.close()
+        return self._conn_cls(
+            self._host,
+            timeout=self._cfg.timeout,
+            connect_timeout=self._cfg.connect_timeout,
+        )
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection whose response was fully read to the pool."""
+        with self._idle_lock:
+            if len(self._idle) < self._cfg.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
     @staticmethod
     def _is_json_response(headers: Dict[str, str]) -> bool:
         """
@@ -501,7 +841,7 @@ class AtlasClient:
 
         if "application/json" in headers.get("content-type", ""):
             try:
-                decoded = json.loads(text)
+                decoded = _decode_json(raw)
                 if isinstance(decoded, dict) and "error" in decoded:
                     detail = APIErrorDetail.from_api(decoded)
                     msg = detail.detail or detail.code or f"HTTP {status}"
@@ -529,3 +869,109 @@ class AtlasClient:
             error_detail=detail,
             raw_body=text,
         )
+
+
+# --------------------------------------------------------------------------- #
+# Shared clients
+# --------------------------------------------------------------------------- #
+
+
+_client_cache: Dict[Tuple[Any, ...], AtlasClient] = {}
+_client_cache_lock = threading.Lock()
+
+
+def get_client(config: AtlasClientConfig) -> AtlasClient:
+    """
+    Return a process-wide AtlasClient for `config`.
+
+    Clients are shared between callers whose configurations are equal
+    (same base URL, credentials, timeouts, ...), so tools that create a
+    client per command or per call reuse one instance and whatever
+    connection state it holds. Construct `AtlasClient` directly for an
+    isolated instance.
+
+    The shared client works on a copy of `config`, so mutating the
+    config object afterwards affects neither that client nor the lookup.
+    """
+    key = astuple(config)
+    client = _client_cache.get(key)
+    if client is None:
+        with _client_cache_lock:
+            client = _client_cache.get(key)
+            if client is None:
+                client = _client_cache[key] = AtlasClient(replace(config))
+    return client
+
+
+class _ConnectTimeoutMixin:
+    """
+    Connect with a shorter timeout than the one used for reads.
+
+    http.client applies a single `timeout` to both; this swaps in
+    `connect_timeout` while the socket (and any TLS session) is set up.
+    """
+
+    timeout: Any
+    sock: Any
+
+    def __init__(self, *args: Any, connect_timeout: float, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[call-arg]
+        self._connect_timeout = connect_timeout
+
+    def connect(self) -> None:
+        read_timeout = self.timeout
+        if read_timeout is not None and 0 < self._connect_timeout < read_timeout:
+            self.timeout = self._connect_timeout
+        try:
+            super().connect()  # type: ignore[misc]
+        finally:
+            self.timeout = read_timeout
+        self.sock.settimeout(read_timeout)
+
+
+class _HTTPConnection(_ConnectTimeoutMixin, http.client.HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_ConnectTimeoutMixin, http.client.HTTPSConnection):
+    pass
+
+
+def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """
+    Return True if an idle connection can no longer be reused.
+
+    An idle keep-alive socket should have nothing to read; if it is
+    readable, the server closed it (or sent stray data) while it sat in
+    the pool.
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _encode_json(body: Any) -> bytes:
+    """Encode a request body as UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    """
+    Decode a UTF-8 JSON response body, using orjson when available.
+
+    Bodies orjson rejects (invalid UTF-8, NaN/Infinity) are decoded by
+    the stdlib as before. Raises json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8", errors="replace"))
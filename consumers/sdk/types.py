@@ -14,10 +14,24 @@ agents that:
 
 All types below use only standard-library types (str, dict, list, etc.)
 so they can be safely used in any environment.
+
+List endpoints return hundreds of records, so the `from_*` factories are
+on the client's hot path: the types use `__slots__`, and the factories
+call the constructor positionally (arguments in field declaration order)
+rather than by keyword.
+
+Ownership: the factories do not copy. Nested dicts and lists from the
+payload (`metadata`, `environment`, `fingerprints`, `tags`,
+`bounding_box`, ...) become the views' attributes as-is, so a payload
+freshly decoded by the client is owned by the views built from it.
+Treat these containers as read-mostly, and pass `copy=True` to a factory
+when the payload is shared with other code and the views must not alias
+it.
 """
 
 from __future__ import annotations
 
+from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -30,7 +44,7 @@ JSONDict = Dict[str, Any]
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextInfo:
     """
     High-level representation of an Atlas context.
@@ -61,20 +75,23 @@ class ContextInfo:
     metadata: JSONDict = field(default_factory=dict)
 
     @classmethod
-    def from_api(cls, payload: JSONDict) -> "ContextInfo":
+    def from_api(cls, payload: JSONDict, *, copy: bool = False) -> "ContextInfo":
         """
         Create a ContextInfo from a dict returned by the Atlas API.
         """
+        if copy:
+            payload = deepcopy(payload)
+        get = payload.get
         return cls(
-            context_id=payload["context_id"],
-            app_id=payload["app_id"],
-            version=payload.get("version"),
-            platform=payload.get("platform"),
-            locale=payload.get("locale"),
-            schema_version=payload.get("schema_version"),
-            created_at=payload.get("created_at"),
-            environment=dict(payload.get("environment") or {}),
-            metadata=dict(payload.get("metadata") or {}),
+            payload["context_id"],
+            payload["app_id"],
+            get("version"),
+            get("platform"),
+            get("locale"),
+            get("schema_version"),
+            get("created_at"),
+            get("environment") or {},
+            get("metadata") or {},
         )
 
 
@@ -83,7 +100,7 @@ class ContextInfo:
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(slots=True)
 class UIElementHint:
     """
     Lightweight representation of an interactive UI element.
@@ -115,20 +132,23 @@ class UIElementHint:
     metadata: JSONDict = field(default_factory=dict)
 
     @classmethod
-    def from_api(cls, payload: JSONDict) -> "UIElementHint":
+    def from_api(cls, payload: JSONDict, *, copy: bool = False) -> "UIElementHint":
+        if copy:
+            payload = deepcopy(payload)
+        get = payload.get
         return cls(
-            id=payload["id"],
-            role=payload["role"],
-            label=payload.get("label"),
-            bounding_box=payload.get("bounding_box"),
-            path=payload.get("path"),
-            enabled=bool(payload.get("enabled", True)),
-            visible=bool(payload.get("visible", True)),
-            metadata=dict(payload.get("metadata") or {}),
+            payload["id"],
+            payload["role"],
+            get("label"),
+            get("bounding_box"),
+            get("path"),
+            bool(get("enabled", True)),
+            bool(get("visible", True)),
+            get("metadata") or {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StateView:
     """
     Consumer-friendly view of a single UI state in a context.
@@ -177,41 +197,37 @@ class StateView:
     state_metadata: JSONDict = field(default_factory=dict)
 
     @classmethod
-    def from_state_record(cls, payload: JSONDict) -> "StateView":
+    def from_state_record(cls, payload: JSONDict, *, copy: bool = False) -> "StateView":
         """
         Build a StateView from a state record dict as returned by
         `QueryHandler._state_record_to_dict` (used in list/get states).
         """
-        ctx_id = payload["context_id"]
-        discovered_at = payload.get("discovered_at")
-        is_entry = bool(payload.get("is_entry", False))
-        is_terminal = bool(payload.get("is_terminal", False))
-        tags = list(payload.get("tags") or [])
-        tracker_meta = dict(payload.get("metadata") or {})
-
+        if copy:
+            payload = deepcopy(payload)
+        get = payload.get
         state_dict = payload["state"]
-        state_id = state_dict["id"]
-        app_id = state_dict["app_id"]
+        state_get = state_dict.get
 
-        interactive_raw = state_dict.get("interactive_elements") or []
-        elements = [UIElementHint.from_api(e) for e in interactive_raw]
+        interactive_raw = state_get("interactive_elements") or []
+        hint = UIElementHint.from_api
+        elements = [hint(e) for e in interactive_raw]
 
         return cls(
-            context_id=ctx_id,
-            state_id=state_id,
-            discovered_at=discovered_at,
-            is_entry=is_entry,
-            is_terminal=is_terminal,
-            tags=tags,
-            tracker_metadata=tracker_meta,
-            app_id=app_id,
-            version=state_dict.get("version"),
-            platform=state_dict.get("platform"),
-            locale=state_dict.get("locale"),
-            fingerprints=dict(state_dict.get("fingerprints") or {}),
-            screenshot_ref=state_dict.get("screenshot_ref"),
-            interactive_elements=elements,
-            state_metadata=dict(state_dict.get("metadata") or {}),
+            payload["context_id"],
+            state_dict["id"],
+            get("discovered_at"),
+            bool(get("is_entry", False)),
+            bool(get("is_terminal", False)),
+            get("tags") or [],
+            get("metadata") or {},
+            state_dict["app_id"],
+            state_get("version"),
+            state_get("platform"),
+            state_get("locale"),
+            state_get("fingerprints") or {},
+            state_get("screenshot_ref"),
+            elements,
+            state_get("metadata") or {},
         )
 
 
@@ -220,7 +236,7 @@ class StateView:
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionView:
     """
     Lightweight representation of a user action causing a transition.
@@ -241,16 +257,19 @@ class ActionView:
     metadata: JSONDict = field(default_factory=dict)
 
     @classmethod
-    def from_api(cls, payload: JSONDict) -> "ActionView":
+    def from_api(cls, payload: JSONDict, *, copy: bool = False) -> "ActionView":
+        if copy:
+            payload = deepcopy(payload)
+        get = payload.get
         return cls(
-            type=payload.get("type", "other"),
-            element_id=payload.get("element_id"),
-            raw_input=payload.get("raw_input"),
-            metadata=dict(payload.get("metadata") or {}),
+            get("type", "other"),
+            get("element_id"),
+            get("raw_input"),
+            get("metadata") or {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitionView:
     """
     Consumer-friendly view of a transition between two states.
@@ -290,37 +309,31 @@ class TransitionView:
     transition_metadata: JSONDict = field(default_factory=dict)
 
     @classmethod
-    def from_transition_record(cls, payload: JSONDict) -> "TransitionView":
+    def from_transition_record(
+        cls, payload: JSONDict, *, copy: bool = False
+    ) -> "TransitionView":
         """
         Build a TransitionView from a transition record dict as returned by
         `QueryHandler._transition_record_to_dict`.
         """
-        ctx_id = payload["context_id"]
-        discovered_at = payload.get("discovered_at")
-        times_observed = int(payload.get("times_observed", 1))
-        store_meta = dict(payload.get("metadata") or {})
-
+        if copy:
+            payload = deepcopy(payload)
+        get = payload.get
         tr_dict = payload["transition"]
-        tr_id = tr_dict["id"]
-        src = tr_dict["source_state_id"]
-        tgt = tr_dict["target_state_id"]
-        act = ActionView.from_api(tr_dict.get("action") or {})
-        intent_id = tr_dict.get("intent_id")
-        confidence = float(tr_dict.get("confidence", 1.0))
-        tr_meta = dict(tr_dict.get("metadata") or {})
+        tr_get = tr_dict.get
 
         return cls(
-            context_id=ctx_id,
-            transition_id=tr_id,
-            discovered_at=discovered_at,
-            times_observed=times_observed,
-            store_metadata=store_meta,
-            source_state_id=src,
-            target_state_id=tgt,
-            action=act,
-            intent_id=intent_id,
-            confidence=confidence,
-            transition_metadata=tr_meta,
+            payload["context_id"],
+            tr_dict["id"],
+            get("discovered_at"),
+            int(get("times_observed", 1)),
+            get("metadata") or {},
+            tr_dict["source_state_id"],
+            tr_dict["target_state_id"],
+            ActionView.from_api(tr_get("action") or {}),
+            tr_get("intent_id"),
+            float(tr_get("confidence", 1.0)),
+            tr_get("metadata") or {},
         )
 
 
@@ -329,7 +342,7 @@ class TransitionView:
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(slots=True)
 class PathView:
     """
     Representation of a shortest-path query between two states.
@@ -354,24 +367,21 @@ class PathView:
     transitions: Optional[List[TransitionView]]  # None = no path found
 
     @classmethod
-    def from_api(cls, payload: JSONDict) -> "PathView":
-        ctx_id = payload["context_id"]
-        src = payload["source_state_id"]
-        tgt = payload["target_state_id"]
+    def from_api(cls, payload: JSONDict, *, copy: bool = False) -> "PathView":
+        if copy:
+            payload = deepcopy(payload)
         raw_path = payload.get("path")
 
         if raw_path is None:
             transitions: Optional[List[TransitionView]] = None
         else:
-            transitions = [
-                TransitionView.from_transition_record(tr_record) for tr_record in raw_path
-            ]
+            transitions = list(map(TransitionView.from_transition_record, raw_path))
 
         return cls(
-            context_id=ctx_id,
-            source_state_id=src,
-            target_state_id=tgt,
-            transitions=transitions,
+            payload["context_id"],
+            payload["source_state_id"],
+            payload["target_state_id"],
+            transitions,
         )
 
     def is_empty(self) -> bool:
@@ -386,7 +396,7 @@ class PathView:
 # --------------------------------------------------------------------------- #
 
 
-@dataclass
+@dataclass(slots=True)
 class APIErrorDetail:
     """
     Structured representation of an error response from the Atlas API.
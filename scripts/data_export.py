@@ -38,7 +38,7 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from consumers.sdk.client import AtlasClient, AtlasClientConfig, AtlasClientError
+from consumers.sdk.client import AtlasClient, AtlasClientConfig, AtlasClientError, get_client
 from consumers.sdk.types import ContextInfo
 
 
@@ -280,7 +280,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         api_key=args.api_key,
         timeout=args.timeout,
     )
-    client = AtlasClient(cfg)
+    client = get_client(cfg)
 
     try:
         if args.command == "list-contexts":
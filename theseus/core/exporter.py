@@ -17,6 +17,9 @@ It does NOT perform any I/O by itself. Callers can:
 
 - Use `build_bundle()` and send the result to an HTTP API (/ingest/bundle).
 - Or manually persist the objects with a custom backend.
+- Or feed transitions in one at a time with `append_transition()` and
+  persist each returned record as it is produced (e.g. to a JSONL spool),
+  so long sessions do not serialize everything at the end.
 """
 
 from __future__ import annotations
@@ -204,18 +207,19 @@ class Exporter:
         context = self.build_context()
         context_id = context.context_id
 
-        records: List[TransitionRecord] = []
-        for tr in self.transitions:
-            record = TransitionRecord(
-                context_id=context_id,
-                transition=tr,
-                # discovered_at default is "now". If you want to track precise
-                # observation time per transition, you can extend Transition
-                # metadata and override this here.
-            )
-            records.append(record)
+        return [self._make_transition_record(context_id, tr) for tr in self.transitions]
 
-        return records
+    def append_transition(self, transition: Transition) -> TransitionRecord:
+        """
+        Add a newly observed transition and return its TransitionRecord.
+
+        This is the incremental counterpart of `build_transition_records()`
+        for callers that export while a session is still running. The
+        transition is also kept in `self.transitions`, so entry/terminal
+        flags computed later by `build_state_records()` account for it.
+        """
+        self.transitions.append(transition)
+        return self._make_transition_record(self.build_context().context_id, transition)
 
     def build_bundle(self) -> Dict[str, Any]:
         """
@@ -256,6 +260,16 @@ class Exporter:
         # when all are in UTC with the same format, which we enforce.
         return min(all_tracked, key=lambda ts: ts.first_seen_at)
 
+    @staticmethod
+    def _make_transition_record(context_id: str, tr: Transition) -> TransitionRecord:
+        return TransitionRecord(
+            context_id=context_id,
+            transition=tr,
+            # discovered_at default is "now". If you want to track precise
+            # observation time per transition, you can extend Transition
+            # metadata and override this here.
+        )
+
     @staticmethod
     def _generate_context_id(app_id: str) -> str:
         """
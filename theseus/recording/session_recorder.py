@@ -167,6 +167,11 @@ class SessionRecorder:
         """Author / operator identifier, if provided."""
         return self._author
 
+    @property
+    def last_transition(self) -> Optional[Transition]:
+        """The most recently recorded transition, or None before the first step."""
+        return self._transitions[-1] if self._transitions else None
+
     def begin(self, initial_state: Optional[UIState] = None) -> UIState:
         """
         Capture and register the initial state for the session.